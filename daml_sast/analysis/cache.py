@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from daml_sast.analysis.lifecycle import UpdateOp, collect_update_ops, contains_get_time
+from daml_sast.analysis.party import PartySet, infer_party_set
+from daml_sast.ir.model import Expr, Template
+
+
+class AnalysisCache:
+    """Memoizes analysis results per expression so rules share one traversal.
+
+    Entries are keyed by ``id()`` of the expression or template; a cache must not outlive the program it was
+    filled from. The walker creates one per module, and every rule visiting that
+    module shares it, so an analysis runs only if some enabled rule asks for it.
+    """
+
+    __slots__ = ("_party_sets", "_get_time", "_update_ops", "_allowed")
+
+    def __init__(self) -> None:
+        self._party_sets: dict[int, PartySet] = {}
+        self._get_time: dict[int, bool] = {}
+        self._update_ops: dict[int, list[UpdateOp]] = {}
+        self._allowed: dict[int, PartySet] = {}
+
+    def party_set(self, expr: Expr) -> PartySet:
+        key = id(expr)
+        result = self._party_sets.get(key)
+        if result is None:
+            result = infer_party_set(expr)
+            self._party_sets[key] = result
+        return result
+
+    # Signatories plus key maintainers: the parties allowed to control choices.
+    def allowed_parties(self, template: Template) -> PartySet:
+        key = id(template)
+        result = self._allowed.get(key)
+        if result is None:
+            result = self.party_set(template.signatories)
+            if template.key:
+                result = result.union(self.party_set(template.key.maintainers))
+            self._allowed[key] = result
+        return result
+
+    def contains_get_time(self, expr: Expr) -> bool:
+        return contains_get_time(expr, self._get_time)
+
+    def update_ops(self, expr: Expr) -> list[UpdateOp]:
+        key = id(expr)
+        result = self._update_ops.get(key)
+        if result is None:
+            result = collect_update_ops(expr)
+            self._update_ops[key] = result
+        return result
@@ -16,8 +16,9 @@ class UpdateOp:
 
 def collect_update_ops(expr: Expr) -> list[UpdateOp]:
     ops: list[UpdateOp] = []
-
-    def walk(node: Expr) -> None:
+    stack = [expr]
+    while stack:
+        node = stack.pop()
         if node.kind.startswith("update."):
             if node.kind == "update.create":
                 ops.append(UpdateOp(kind="create", template=_template_from(node)))
@@ -52,12 +53,34 @@ def collect_update_ops(expr: Expr) -> list[UpdateOp]:
                 ops.append(UpdateOp(kind="ledger_time_lt"))
             elif node.kind == "update.get_time":
                 ops.append(UpdateOp(kind="get_time"))
+        # Reversed so children are visited left to right, as in a recursive walk.
+        stack.extend(reversed(node.children))
+    return ops
 
-        for child in node.children:
-            walk(child)
 
-    walk(expr)
-    return ops
+def contains_get_time(expr: Expr, memo: dict[int, bool] | None = None) -> bool:
+    if memo is None:
+        memo = {}
+    root = id(expr)
+    cached = memo.get(root)
+    if cached is not None:
+        return cached
+    result = False
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        seen = memo.get(id(node))
+        if seen is not None:
+            if seen:
+                result = True
+                break
+            continue
+        if node.kind == "update.get_time" or (node.kind == "builtin" and node.value == "getTime"):
+            result = True
+            break
+        stack.extend(node.children)
+    memo[root] = result
+    return result
 
 
 def _template_from(node: Expr) -> str | None:
@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from typing import Iterable
 
 from daml_sast.config import load_config
-from daml_sast.engine.runner import run
+from daml_sast.engine.runner import run, with_fingerprints
 from daml_sast.lf.loader import load_program_from_dar
 from daml_sast.report.json_report import emit_json
 from daml_sast.report.sarif_report import SarifContext, emit_sarif
@@ -122,6 +122,11 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     scan.add_argument("--write-baseline", help="Write baseline JSON to path")
     scan.add_argument("--ci", action="store_true", help="Emit CI-oriented metadata")
     scan.add_argument("--suppressions", help="Path to suppression file (default: .daml-sast-ignore)")
+    scan.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for rule evaluation on large programs (default: 1, serial)",
+    )
 
     return parser.parse_args(argv)
 
@@ -130,6 +135,9 @@ def main(argv: Iterable[str] | None = None) -> int:
     args = parse_args(argv)
     if args.command != "scan":
         return EXIT_USAGE
+    if args.jobs is not None and args.jobs < 1:
+        print("error: --jobs must be at least 1", file=sys.stderr)
+        return EXIT_USAGE
 
     try:
         cfg = load_config(args.config)
@@ -163,17 +171,24 @@ def main(argv: Iterable[str] | None = None) -> int:
     rules = filter_rules(registry(), allow, deny)
     rule_meta = {r.meta.id: r.meta for r in rules}
     start_time = datetime.now(timezone.utc)
-    findings = run(rules, program)
-    all_fingerprints = [f.fingerprint for f in findings if f.fingerprint]
+    # Fingerprints are only needed up front when writing a baseline; otherwise
+    # findings dropped by severity or glob suppressions are never hashed.
+    findings = run(rules, program, fingerprint=bool(write_baseline_path), workers=args.jobs)
     if write_baseline_path:
+        all_fingerprints = [f.fingerprint for f in findings if f.fingerprint]
         write_baseline(write_baseline_path, all_fingerprints)
 
     findings = _filter_by_severity(findings, min_sev)
     from daml_sast.suppress import apply_suppressions, load_suppressions
 
     suppressions = load_suppressions(suppressions_path)
-    if suppressions:
-        findings = apply_suppressions(findings, suppressions)
+    patterns = [s for s in suppressions if not s.fingerprint]
+    pinned = [s for s in suppressions if s.fingerprint]
+    if patterns:
+        findings = apply_suppressions(findings, patterns)
+    findings = with_fingerprints(findings)
+    if pinned:
+        findings = apply_suppressions(findings, pinned)
     if baseline_path:
         try:
             suppressed = load_baseline(baseline_path)
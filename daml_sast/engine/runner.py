@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import replace
-from typing import Iterable
+from typing import Iterable, Optional
 
 from daml_sast.ir.model import Program
 from daml_sast.model import Finding
 from daml_sast.rules.base import Rule
 from daml_sast.util.fingerprint import compute_fingerprint
-from daml_sast.walker.walk import walk_program
+from daml_sast.walker.walk import Visitors, walk_module, walk_package, walk_program
 
+# Below this many templates forking workers costs more than it saves.
+_PARALLEL_MIN_TEMPLATES = 64
 
-def run(rules: Iterable[Rule], program: Program) -> list[Finding]:
-    findings: list[Finding] = []
+# Program and rules of the worker's own scan, set once by _init_worker in each
+# forked worker process. The parent never sets it, so concurrent run() calls in
+# one process cannot see each other's state.
+_WORKER_STATE: Optional[tuple[Program, Visitors]] = None
+
+
+def run(
+    rules: Iterable[Rule],
+    program: Program,
+    *,
+    fingerprint: bool = True,
+    workers: int = 1,
+) -> list[Finding]:
+    # fingerprint=False leaves hashing to the caller, e.g. after suppressions.
+    # workers > 1 opts into forked rule workers; every finding then crosses a
+    # pickle boundary, which can cost as much as the walk itself.
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    findings = _collect(tuple(rules), program, workers)
+    return with_fingerprints(findings) if fingerprint else findings
 
-    def emit(f: Finding) -> None:
-        findings.append(f)
 
-    walk_program(program, rules, emit)
+def with_fingerprints(findings: Iterable[Finding]) -> list[Finding]:
     finalized: list[Finding] = []
     for f in findings:
         if f.fingerprint:
@@ -26,3 +46,50 @@ def run(rules: Iterable[Rule], program: Program) -> list[Finding]:
             continue
         finalized.append(replace(f, fingerprint=compute_fingerprint(f)))
     return finalized
+
+
+def _collect(rules: tuple[Rule, ...], program: Program, max_workers: int) -> list[Finding]:
+    findings: list[Finding] = []
+    modules = [(p, m) for p, pkg in enumerate(program.packages) for m in range(len(pkg.modules))]
+    templates = sum(len(mod.templates) for pkg in program.packages for mod in pkg.modules)
+    workers = min(max_workers, len(modules))
+    if (
+        templates < _PARALLEL_MIN_TEMPLATES
+        or workers < 2
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        walk_program(program, rules, findings.append)
+        return findings
+
+    # Modules are independent, so each worker walks whole modules and the
+    # results are merged back in walk order. Forked workers inherit the
+    # initializer arguments, so the program is never pickled.
+    visitors = Visitors(rules)
+    ctx = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(program, visitors),
+    ) as ex:
+        per_module = ex.map(_walk_module_at, modules, chunksize=4)
+        for pkg in program.packages:
+            walk_package(pkg, visitors, findings.append)
+            for _ in pkg.modules:
+                findings.extend(next(per_module))
+    return findings
+
+
+def _init_worker(program: Program, visitors: Visitors) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (program, visitors)
+
+
+def _walk_module_at(loc: tuple[int, int]) -> list[Finding]:
+    if _WORKER_STATE is None:
+        raise RuntimeError("Rule worker started without a program")
+    program, visitors = _WORKER_STATE
+    pkg = program.packages[loc[0]]
+    findings: list[Finding] = []
+    walk_module(pkg, pkg.modules[loc[1]], visitors, findings.append)
+    return findings
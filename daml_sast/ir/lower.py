@@ -77,7 +77,7 @@ def _lower_lf1_modules(pkg: LfPackage, resolver: Lf1Resolver) -> list[Module]:
 def _lf1_module_name(mod: daml_lf1_pb2.Module, resolver: Lf1Resolver) -> str:
     which = mod.WhichOneof("name")
     if which == "name_dname":
-        return resolver.dotted_name(list(mod.name_dname.segments))
+        return resolver.dotted_name(mod.name_dname.segments)
     if which == "name_interned_dname":
         return resolver.interned_dname(mod.name_interned_dname)
     return "<module>"
@@ -91,7 +91,7 @@ def _lower_lf1_template(
 ) -> Template:
     which = tmpl.WhichOneof("tycon")
     if which == "tycon_dname":
-        name = resolver.dotted_name(list(tmpl.tycon_dname.segments))
+        name = resolver.dotted_name(tmpl.tycon_dname.segments)
     else:
         name = resolver.interned_dname(tmpl.tycon_interned_dname)
     template_name = f"{module_name}.{name}"
@@ -229,7 +229,7 @@ def _lower_lf1_value(
 ) -> ValueDef:
     name = "<value>"
     if val.name_with_type.name_dname:
-        name = resolver.dotted_name(list(val.name_with_type.name_dname))
+        name = resolver.dotted_name(val.name_with_type.name_dname)
     else:
         name = resolver.interned_dname(val.name_with_type.name_interned_dname)
     typ = _lower_type_lf1(val.name_with_type.type, resolver)
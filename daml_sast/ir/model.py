@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceSpan:
     file: Optional[str] = None
     start_line: Optional[int] = None
@@ -15,7 +16,7 @@ class SourceSpan:
     end_col: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     module: str
     definition: str
@@ -32,6 +33,11 @@ class Type:
         return self.kind == "con" and self.name == "Party"
 
     def is_party_list(self) -> bool:
+        return self._is_party_list
+
+    # Types are shared across many expressions; compute the check once per instance.
+    @cached_property
+    def _is_party_list(self) -> bool:
         return self.kind == "list" and len(self.args) == 1 and self.args[0].is_party()
 
 
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import io
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, Union
 import zipfile
 
 from daml_sast.lf.limits import limits
@@ -17,11 +18,19 @@ class DalfEntry:
 
 
 def extract_dalf_entries(dar_path: str) -> List[DalfEntry]:
-    lim = limits()
     try:
         size = Path(dar_path).stat().st_size
     except OSError as exc:
         raise ValueError(f"Failed to read DAR: {exc}") from exc
+    return _extract(dar_path, size)
+
+
+def extract_dalf_entries_from_bytes(data: bytes) -> List[DalfEntry]:
+    return _extract(io.BytesIO(data), len(data))
+
+
+def _extract(source: Union[str, BinaryIO], size: int) -> List[DalfEntry]:
+    lim = limits()
     if size > lim.max_dar_bytes:
         raise ValueError(
             f"DAR size {size} exceeds max {lim.max_dar_bytes} bytes"
@@ -29,7 +38,7 @@ def extract_dalf_entries(dar_path: str) -> List[DalfEntry]:
 
     entries: List[DalfEntry] = []
     try:
-        with zipfile.ZipFile(dar_path, "r") as zf:
+        with zipfile.ZipFile(source, "r") as zf:
             infos = zf.infolist()
             if len(infos) > lim.max_dar_entries:
                 raise ValueError(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from google.protobuf.message import DecodeError
 
@@ -17,17 +17,19 @@ from daml_sast.lf.proto.com.digitalasset.daml.lf.archive import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InternedTables:
     strings: list[str]
     dotted_names: list[str]
-    types: list[Any]
-    kinds: list[Any]
-    exprs: list[Any]
+    # Repeated-composite containers from the decoded package; read-only, indexed by
+    # the lowering pass, so they are kept as-is rather than copied into lists.
+    types: Sequence[Any]
+    kinds: Sequence[Any]
+    exprs: Sequence[Any]
     imports: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LfPackage:
     package_id: str
     name: str
@@ -37,8 +39,9 @@ class LfPackage:
     lf_major: int
     lf_minor: int
     lf_patch: Optional[int]
-    archive_payload: bytes
-    package_bytes: bytes
+    # Raw payloads are only retained when decode_dalf(..., keep_raw=True).
+    archive_payload: Optional[bytes]
+    package_bytes: Optional[bytes]
     dalf_path: str
     lf_package: Any
     interned: InternedTables
@@ -48,7 +51,7 @@ class ProtoDecodeError(ValueError):
     pass
 
 
-def decode_dalf(entry: DalfEntry) -> LfPackage:
+def decode_dalf(entry: DalfEntry, *, keep_raw: bool = True) -> LfPackage:
     lim = limits()
     if len(entry.raw) > lim.max_dalf_bytes:
         raise ProtoDecodeError(
@@ -132,8 +135,8 @@ def decode_dalf(entry: DalfEntry) -> LfPackage:
         lf_major=version.major,
         lf_minor=version.minor,
         lf_patch=version.patch,
-        archive_payload=payload_bytes,
-        package_bytes=package_bytes,
+        archive_payload=payload_bytes if keep_raw else None,
+        package_bytes=package_bytes if keep_raw else None,
         dalf_path=entry.path,
         lf_package=lf_pkg,
         interned=interned,
@@ -165,9 +168,10 @@ def _extract_interned_tables(major: int, pkg: Any) -> InternedTables:
         segments = [strings[i] for i in dotted.segments_interned_str if i < len(strings)]
         dotted_names.append(".".join(segments))
 
-    types = list(pkg.interned_types)
-    kinds = list(getattr(pkg, "interned_kinds", []))
-    exprs = list(getattr(pkg, "interned_exprs", []))
+    has_kinds, has_exprs = _interned_field_presence(pkg)
+    types = pkg.interned_types
+    kinds = pkg.interned_kinds if has_kinds else ()
+    exprs = pkg.interned_exprs if has_exprs else ()
 
     imports: list[str] = []
     if major == 2:
@@ -185,6 +189,19 @@ def _extract_interned_tables(major: int, pkg: Any) -> InternedTables:
     )
 
 
+_INTERNED_FIELD_PRESENCE: dict[type, tuple[bool, bool]] = {}
+
+
+def _interned_field_presence(pkg: Any) -> tuple[bool, bool]:
+    cls = type(pkg)
+    presence = _INTERNED_FIELD_PRESENCE.get(cls)
+    if presence is None:
+        by_name = pkg.DESCRIPTOR.fields_by_name
+        presence = ("interned_kinds" in by_name, "interned_exprs" in by_name)
+        _INTERNED_FIELD_PRESENCE[cls] = presence
+    return presence
+
+
 def _extract_metadata(major: int, pkg: Any, interned: InternedTables) -> tuple[str, str]:
     if not hasattr(pkg, "metadata"):
         return "", ""
@@ -229,9 +246,23 @@ def _decode_lf1_fallback_as_lf2(
     return lf2_pkg, version, 2
 
 
+# Protobuf runtimes refuse to parse messages nested deeper than this.
+_PARSER_MAX_DEPTH = 100
+
+
+def _within_proto_limits_by_size(msg: Any, *, max_depth: int, max_nodes: int) -> bool:
+    # Every nested message costs at least two bytes on the wire (tag + length), so the
+    # serialized size bounds both node count and depth without walking the tree.
+    bound = 1 + msg.ByteSize() // 2
+    depth_bound = min(bound, _PARSER_MAX_DEPTH + 1)
+    return bound <= max_nodes and depth_bound <= max_depth
+
+
 def _enforce_proto_limits(
     msg: Any, *, max_depth: int, max_nodes: int, label: str
 ) -> None:
+    if _within_proto_limits_by_size(msg, max_depth=max_depth, max_nodes=max_nodes):
+        return
     stack: list[tuple[Any, int]] = [(msg, 1)]
     seen = 0
     while stack:
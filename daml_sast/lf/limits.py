@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import os
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LfLimits:
     max_dar_bytes: int
     max_dar_uncompressed_bytes: int
@@ -31,6 +32,7 @@ def _env_int(name: str, default: int) -> int:
     return value
 
 
+@functools.lru_cache(maxsize=1)
 def limits() -> LfLimits:
     return LfLimits(
         max_dar_bytes=_env_int("DAML_SAST_MAX_DAR_BYTES", 200 * 1024 * 1024),
@@ -46,3 +48,8 @@ def limits() -> LfLimits:
         max_proto_depth=_env_int("DAML_SAST_MAX_PROTO_DEPTH", 200),
         max_proto_nodes=_env_int("DAML_SAST_MAX_PROTO_NODES", 500_000),
     )
+
+
+def _reset_limits_cache() -> None:
+    """Drop the cached limits so the next call re-reads the environment."""
+    limits.cache_clear()
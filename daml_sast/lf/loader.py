@@ -4,13 +4,25 @@ from __future__ import annotations
 
 from daml_sast.ir.model import Program
 from daml_sast.ir.lower import lower_packages
-from daml_sast.lf.archive import extract_dalf_entries
-from daml_sast.lf.decoder import decode_dalf
+from daml_sast.lf.archive import DalfEntry, extract_dalf_entries, extract_dalf_entries_from_bytes
+from daml_sast.lf.decoder import LfPackage, decode_dalf
 
 
 def load_program_from_dar(path: str) -> Program:
-    entries = extract_dalf_entries(path)
+    return _load_entries(extract_dalf_entries(path))
+
+
+def load_program_from_dar_bytes(data: bytes) -> Program:
+    return _load_entries(extract_dalf_entries_from_bytes(data))
+
+
+def _load_entries(entries: list[DalfEntry]) -> Program:
     if not entries:
         raise ValueError("No .dalf entries found in DAR")
-    packages = [decode_dalf(entry) for entry in entries]
+    packages = _decode_entries(entries)
     return lower_packages(packages)
+
+
+def _decode_entries(entries: list[DalfEntry]) -> list[LfPackage]:
+    # Lowering only needs the parsed package, so the raw payload bytes are not kept.
+    return [decode_dalf(entry, keep_raw=False) for entry in entries]
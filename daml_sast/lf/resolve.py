@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
 
 from daml_sast.lf.decoder import InternedTables
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedName:
     package_id: str
     module: str
     name: str
+    _fqn: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_fqn", f"{self.module}.{self.name}" if self.module else self.name)
 
     def fqn(self) -> str:
-        return f"{self.module}.{self.name}" if self.module else self.name
+        return self._fqn
 
 
 class LfResolverBase:
@@ -33,7 +37,7 @@ class LfResolverBase:
             return self.interned.dotted_names[idx]
         return f"<dname:{idx}>"
 
-    def dotted_name(self, segments: list[str]) -> str:
+    def dotted_name(self, segments: Iterable[str]) -> str:
         return ".".join(segments)
 
     def fqn_with_package(self, pkg_id: str, module: str, name: str) -> str:
@@ -46,20 +50,14 @@ class LfResolverBase:
 
 class Lf1Resolver(LfResolverBase):
     def resolve_package_ref(self, pkg_ref: Any) -> str:
-        which = pkg_ref.WhichOneof("Sum")
-        if which == "self":
-            return self.package_id
-        if which == "package_id_str":
-            return pkg_ref.package_id_str
-        if which == "package_id_interned_str":
-            return self.interned_str(pkg_ref.package_id_interned_str)
-        return "<pkg:unknown>"
+        handler = _LF1_PKG_REF_HANDLERS.get(pkg_ref.WhichOneof("Sum"))
+        return handler(self, pkg_ref) if handler else "<pkg:unknown>"
 
     def resolve_module_ref(self, module_ref: Any) -> ResolvedName:
         pkg_id = self.resolve_package_ref(module_ref.package_ref)
         which = module_ref.WhichOneof("module_name")
         if which == "module_name_dname":
-            name = self.dotted_name(list(module_ref.module_name_dname.segments))
+            name = self.dotted_name(module_ref.module_name_dname.segments)
         else:
             name = self.interned_dname(module_ref.module_name_interned_dname)
         return ResolvedName(package_id=pkg_id, module=name, name="")
@@ -68,7 +66,7 @@ class Lf1Resolver(LfResolverBase):
         mod = self.resolve_module_ref(tycon.module)
         which = tycon.WhichOneof("name")
         if which == "name_dname":
-            name = self.dotted_name(list(tycon.name_dname.segments))
+            name = self.dotted_name(tycon.name_dname.segments)
         else:
             name = self.interned_dname(tycon.name_interned_dname)
         return ResolvedName(package_id=mod.package_id, module=mod.module, name=name)
@@ -76,7 +74,7 @@ class Lf1Resolver(LfResolverBase):
     def resolve_val_name(self, val: Any) -> ResolvedName:
         mod = self.resolve_module_ref(val.module)
         if val.name_dname:
-            name = self.dotted_name(list(val.name_dname))
+            name = self.dotted_name(val.name_dname)
         else:
             name = self.interned_dname(val.name_interned_dname)
         return ResolvedName(package_id=mod.package_id, module=mod.module, name=name)
@@ -91,17 +89,13 @@ class Lf1Resolver(LfResolverBase):
 
 class Lf2Resolver(LfResolverBase):
     def resolve_package_id(self, pkg_id: Any) -> str:
-        which = pkg_id.WhichOneof("Sum")
-        if which == "self_package_id":
-            return self.package_id
-        if which == "imported_package_id_interned_str":
-            return self.interned_str(pkg_id.imported_package_id_interned_str)
-        if which == "package_import_id":
-            idx = pkg_id.package_import_id
-            if 0 <= idx < len(self.interned.imports):
-                return self.interned.imports[idx]
-            return f"<import:{idx}>"
-        return "<pkg:unknown>"
+        handler = _LF2_PKG_ID_HANDLERS.get(pkg_id.WhichOneof("Sum"))
+        return handler(self, pkg_id) if handler else "<pkg:unknown>"
+
+    def _import_package_id(self, idx: int) -> str:
+        if 0 <= idx < len(self.interned.imports):
+            return self.interned.imports[idx]
+        return f"<import:{idx}>"
 
     def resolve_module_id(self, module_id: Any) -> ResolvedName:
         pkg_id = self.resolve_package_id(module_id.package_id)
@@ -120,3 +114,18 @@ class Lf2Resolver(LfResolverBase):
 
     def resolve_identifier(self, name_interned: int) -> str:
         return self.interned_str(name_interned)
+
+
+_LF1_PKG_REF_HANDLERS: dict[str, Callable[[Lf1Resolver, Any], str]] = {
+    "self": lambda r, ref: r.package_id,
+    "package_id_str": lambda r, ref: ref.package_id_str,
+    "package_id_interned_str": lambda r, ref: r.interned_str(ref.package_id_interned_str),
+}
+
+_LF2_PKG_ID_HANDLERS: dict[str, Callable[[Lf2Resolver, Any], str]] = {
+    "self_package_id": lambda r, ref: r.package_id,
+    "imported_package_id_interned_str": lambda r, ref: r.interned_str(
+        ref.imported_package_id_interned_str
+    ),
+    "package_import_id": lambda r, ref: r._import_package_id(ref.package_import_id),
+}
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Mapping, Optional
 
-from daml_sast.ir.model import Location
+from daml_sast.ir.model import Location, SourceSpan
 
 
 class Severity(str, Enum):
@@ -22,14 +22,14 @@ class Confidence(str, Enum):
     HIGH = "HIGH"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Evidence:
     kind: str
     note: str
     lf_ref: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     id: str
     title: str
@@ -40,8 +40,40 @@ class Finding:
     location: Location
     evidence: list[Evidence] = field(default_factory=list)
     related: list[Location] = field(default_factory=list)
-    metadata: dict[str, str] = field(default_factory=dict)
+    metadata: Mapping[str, str] = field(default_factory=dict)
     fingerprint: str | None = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "severity": self.severity.value,
+            "confidence": self.confidence.value,
+            "category": self.category,
+            "message": self.message,
+            "location": _location_dict(self.location),
+            "evidence": [
+                {"kind": e.kind, "note": e.note, "lf_ref": e.lf_ref} for e in self.evidence
+            ],
+            "related": [_location_dict(loc) for loc in self.related],
+            "metadata": dict(self.metadata),
+            "fingerprint": self.fingerprint,
+        }
+
+
+def _location_dict(loc: Location) -> dict:
+    return {
+        "module": loc.module,
+        "definition": loc.definition,
+        "span": _span_dict(loc.span) if loc.span is not None else None,
+    }
+
+
+def _span_dict(span: SourceSpan) -> dict:
+    return {
+        "file": span.file,
+        "start_line": span.start_line,
+        "start_col": span.start_col,
+        "end_line": span.end_line,
+        "end_col": span.end_col,
+    }
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import json
 from typing import Iterable, TextIO
 
 from daml_sast.model import Finding
+from daml_sast.util.jsonio import dumps_indented
 
 
 def emit_json(findings: Iterable[Finding], out: TextIO) -> None:
-    payload = [f.to_dict() for f in findings]
-    json.dump(payload, out, indent=2)
-    out.write("\n")
+    # Stream one finding at a time; the layout matches json.dump(..., indent=2).
+    sep = "[\n"
+    for f in findings:
+        out.write(sep)
+        out.write("  " + dumps_indented(f.to_dict()).replace("\n", "\n  "))
+        sep = ",\n"
+    out.write("[]\n" if sep == "[\n" else "\n]\n")
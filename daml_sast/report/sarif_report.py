@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Iterable
 
 from daml_sast.model import Finding
 from daml_sast.rules.base import RuleMeta, Severity
+from daml_sast.util.jsonio import dumps_indented
 from daml_sast.util.version import get_version
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SarifContext:
     command_line: str
     cwd: str
@@ -21,18 +21,63 @@ class SarifContext:
     end_time: datetime
 
 
+_LEVELS = {
+    Severity.CRITICAL: "error",
+    Severity.HIGH: "error",
+    Severity.MEDIUM: "warning",
+    Severity.LOW: "note",
+}
+
+_NO_FINGERPRINT: dict = {}
+
+_UTC = timezone.utc
+
+
 def _level(sev: Severity) -> str:
-    if sev in (Severity.CRITICAL, Severity.HIGH):
-        return "error"
-    if sev == Severity.MEDIUM:
-        return "warning"
-    return "note"
+    return _LEVELS.get(sev, "note")
 
 
 def _to_utc(ts: datetime) -> str:
     if ts.tzinfo is None:
-        ts = ts.replace(tzinfo=timezone.utc)
-    return ts.astimezone(timezone.utc).isoformat()
+        ts = ts.replace(tzinfo=_UTC)
+    elif ts.tzinfo is not _UTC:
+        ts = ts.astimezone(_UTC)
+    return ts.isoformat()
+
+
+def _build_rule(f: Finding, meta: RuleMeta | None) -> dict:
+    return {
+        "id": f.id,
+        "name": f.title,
+        "shortDescription": {"text": f.title},
+        "fullDescription": {"text": meta.description if meta else f.message},
+        "help": {"text": meta.rationale if meta else f.message},
+        "properties": {
+            "category": f.category,
+            "tags": list(meta.tags) if meta else [],
+            "severity": f.severity.value,
+            "confidence": f.confidence.value,
+        },
+    }
+
+
+def _locations(f: Finding) -> list[dict]:
+    span = f.location.span
+    if not span or not span.file:
+        return []
+    return [
+        {
+            "physicalLocation": {
+                "artifactLocation": {"uri": span.file},
+                "region": {
+                    "startLine": span.start_line or 1,
+                    "startColumn": span.start_col or 1,
+                    "endLine": span.end_line or span.start_line or 1,
+                    "endColumn": span.end_col or span.start_col or 1,
+                },
+            }
+        }
+    ]
 
 
 def emit_sarif(
@@ -43,50 +88,26 @@ def emit_sarif(
     context: SarifContext | None = None,
 ) -> None:
     results = []
-    rules = {}
+    rules: dict[str, dict] = {}
+    metas = rule_meta or {}
 
     for f in findings:
-        meta = rule_meta.get(f.id) if rule_meta else None
         if f.id not in rules:
-            rules[f.id] = {
-                "id": f.id,
-                "name": f.title,
-                "shortDescription": {"text": f.title},
-                "fullDescription": {"text": meta.description if meta else f.message},
-                "help": {"text": meta.rationale if meta else f.message},
-                "properties": {
-                    "category": f.category,
-                    "tags": list(meta.tags) if meta else [],
-                    "severity": f.severity.value,
-                    "confidence": f.confidence.value,
-                },
-            }
-
-        loc = None
-        if f.location.span and f.location.span.file:
-            span = f.location.span
-            loc = {
-                "physicalLocation": {
-                    "artifactLocation": {"uri": span.file},
-                    "region": {
-                        "startLine": span.start_line or 1,
-                        "startColumn": span.start_col or 1,
-                        "endLine": span.end_line or span.start_line or 1,
-                        "endColumn": span.end_col or span.start_col or 1,
-                    },
-                }
+            rules[f.id] = _build_rule(f, metas.get(f.id))
+        results.append(
+            {
+                "ruleId": f.id,
+                "level": _level(f.severity),
+                "message": {"text": f.message},
+                "locations": _locations(f),
+                "properties": {"confidence": f.confidence.value, **f.metadata},
+                **(
+                    {"partialFingerprints": {"damlSast/v1": f.fingerprint}}
+                    if f.fingerprint
+                    else _NO_FINGERPRINT
+                ),
             }
-
-        result = {
-            "ruleId": f.id,
-            "level": _level(f.severity),
-            "message": {"text": f.message},
-            "locations": [loc] if loc else [],
-            "properties": {"confidence": f.confidence.value, **f.metadata},
-        }
-        if f.fingerprint:
-            result["partialFingerprints"] = {"damlSast/v1": f.fingerprint}
-        results.append(result)
+        )
 
     run = {
         "tool": {
@@ -119,5 +140,5 @@ def emit_sarif(
         "version": "2.1.0",
         "runs": [run],
     }
-    json.dump(sarif, out, indent=2)
+    out.write(dumps_indented(sarif))
     out.write("\n")
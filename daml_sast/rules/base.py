@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterable, Optional, Protocol
+from typing import Iterable, Mapping, Optional, Protocol
 
+from daml_sast.analysis.cache import AnalysisCache
 from daml_sast.ir.model import Choice, Expr, Module, Package, Template
 from daml_sast.model import Confidence, Finding, Severity
 
@@ -23,7 +24,7 @@ class ExprOwner(str, Enum):
     VALUE_BODY = "value_body"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleMeta:
     id: str
     title: str
@@ -36,13 +37,16 @@ class RuleMeta:
     references: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ctx:
     package_id: str
     module_name: str
     template_name: Optional[str] = None
     choice_name: Optional[str] = None
     path: tuple[str, ...] = ()
+    # Template/choice metadata shared read-only by every finding in this scope.
+    finding_metadata: Mapping[str, str] = field(default_factory=dict)
+    analysis: AnalysisCache = field(default_factory=AnalysisCache, compare=False, repr=False)
 
     def derive(
         self,
@@ -54,12 +58,23 @@ class Ctx:
         path = self.path
         if path_append:
             path = (*path, path_append)
+        finding_metadata = self.finding_metadata
+        if template_name is not None or choice_name is not None:
+            template_name = template_name if template_name is not None else self.template_name
+            choice_name = choice_name if choice_name is not None else self.choice_name
+            finding_metadata = {
+                key: value
+                for key, value in (("template", template_name), ("choice", choice_name))
+                if value is not None
+            }
         return Ctx(
             package_id=self.package_id,
             module_name=self.module_name,
             template_name=template_name if template_name is not None else self.template_name,
             choice_name=choice_name if choice_name is not None else self.choice_name,
             path=path,
+            finding_metadata=finding_metadata,
+            analysis=self.analysis,
         )
 
 
@@ -70,6 +85,9 @@ class Emitter(Protocol):
 
 class Rule:
     meta: RuleMeta
+    # Facts a template/choice must have before visit_template/visit_choice is
+    # dispatched: "key", "nonconsuming".
+    required: frozenset[str] = frozenset()
 
     def visit_package(self, ctx: Ctx, pkg: Package, emit: Emitter) -> None:
         pass
@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Optional
 
-from daml_sast.analysis.lifecycle import collect_update_ops
-from daml_sast.analysis.party import infer_party_set
 from daml_sast.ir.model import Choice, Expr, Location, Template
 from daml_sast.model import Confidence, Evidence, Finding, Severity
 from daml_sast.rules.base import Ctx, Rule, RuleMeta
 
+# Evidence is identical across findings of a rule except for lf_ref, so each
+# rule shares one prototype and only copies it when there is a ref to attach.
+_CONTROLLERS_EVIDENCE = Evidence(kind="choice", note="controllers expression")
+_CHOICE_OBSERVERS_EVIDENCE = Evidence(kind="choice", note="observers expression")
+_SIGNATORIES_EVIDENCE = Evidence(kind="template", note="signatories expression")
+_TEMPLATE_OBSERVERS_EVIDENCE = Evidence(kind="template", note="observers expression")
+_MAINTAINERS_EVIDENCE = Evidence(kind="key", note="maintainers expression")
+_SELF_CREATE_EVIDENCE = Evidence(kind="update", note="update.create of same template")
+_CREATE_EVIDENCE = Evidence(kind="update", note="update.create")
+_FORWARD_EVIDENCE = Evidence(kind="update", note="exercise forwarding")
+_EXPR_EVIDENCE = {
+    owner: Evidence(kind="expr", note=f"{owner} expression")
+    for owner in (
+        "template signatories",
+        "template observers",
+        "key body",
+        "key maintainers",
+        "choice controllers",
+        "choice observers",
+    )
+}
+
+
+def _evidence(proto: Evidence, lf_ref: Optional[str]) -> Evidence:
+    return proto if lf_ref is None else replace(proto, lf_ref=lf_ref)
+
 
 def _location_from(expr: Optional[Expr], ctx: Ctx, default_def: str) -> Location:
     if expr and expr.location:
@@ -18,19 +43,10 @@ def _location_from(expr: Optional[Expr], ctx: Ctx, default_def: str) -> Location
 
 
 def _expr_is_direct_party_list_var(expr: Expr) -> bool:
-    return expr.kind == "var" and expr.typ is not None and expr.typ.is_party_list()
-
-
-def _expr_contains_get_time(expr: Expr) -> bool:
-    for op in collect_update_ops(expr):
-        if op.kind == "get_time":
-            return True
-    if expr.kind == "builtin" and expr.value == "getTime":
-        return True
-    for child in expr.children:
-        if _expr_contains_get_time(child):
-            return True
-    return False
+    if expr.kind != "var":
+        return False
+    typ = expr.typ
+    return typ is not None and typ.is_party_list()
 
 
 class AuthControllerAlignmentRule(Rule):
@@ -46,33 +62,26 @@ class AuthControllerAlignmentRule(Rule):
     )
 
     def visit_choice(self, ctx: Ctx, template: Template, choice: Choice, emit) -> None:
-        controllers = infer_party_set(choice.controllers)
-        signatories = infer_party_set(template.signatories)
-        maintainers = infer_party_set(template.key.maintainers) if template.key else None
-
-        allowed = signatories
-        if maintainers is not None:
-            allowed = allowed.union(maintainers)
-
-        if controllers.is_definitely_not_subset_of(allowed):
+        controllers = ctx.analysis.party_set(choice.controllers)
+        # An unknown or empty controller set can never be definitely misaligned.
+        if controllers.unknown or not controllers.known:
+            return
+        if controllers.is_definitely_not_subset_of(ctx.analysis.allowed_parties(template)):
+            m = self.meta
             loc = _location_from(choice.controllers, ctx, f"Choice {choice.name}")
             emit(
                 Finding(
-                    id=self.meta.id,
-                    title=self.meta.title,
-                    severity=self.meta.severity,
-                    confidence=self.meta.confidence,
-                    category=self.meta.category,
+                    id=m.id,
+                    title=m.title,
+                    severity=m.severity,
+                    confidence=m.confidence,
+                    category=m.category,
                     message="Choice controllers are not a subset of signatories/maintainers.",
                     location=loc,
                     evidence=[
-                        Evidence(
-                            kind="choice",
-                            note="controllers expression",
-                            lf_ref=choice.controllers.lf_ref,
-                        )
+                        _evidence(_CONTROLLERS_EVIDENCE, choice.controllers.lf_ref)
                     ],
-                    metadata={"template": template.name, "choice": choice.name},
+                    metadata=ctx.finding_metadata,
                 )
             )
 
@@ -88,32 +97,34 @@ class NonconsumingCreateRule(Rule):
         rationale="Nonconsuming choices that create new contracts can inflate assets unintentionally.",
         tags=["lifecycle", "asset"],
     )
+    required = frozenset({"nonconsuming"})
 
     def visit_choice(self, ctx: Ctx, template: Template, choice: Choice, emit) -> None:
         if choice.consuming:
             return
-        ops = collect_update_ops(choice.update)
-        if any(op.kind == "create" and op.template == template.name for op in ops):
-            loc = _location_from(choice.update, ctx, f"Choice {choice.name}")
-            emit(
-                Finding(
-                    id=self.meta.id,
-                    title=self.meta.title,
-                    severity=self.meta.severity,
-                    confidence=self.meta.confidence,
-                    category=self.meta.category,
-                    message="Nonconsuming choice creates a new contract of the same template.",
-                    location=loc,
-                    evidence=[
-                        Evidence(
-                            kind="update",
-                            note="update.create of same template",
-                            lf_ref=choice.update.lf_ref,
-                        )
-                    ],
-                    metadata={"template": template.name, "choice": choice.name},
-                )
+        tname = template.name
+        for op in ctx.analysis.update_ops(choice.update):
+            if op.kind == "create" and op.template == tname:
+                break
+        else:
+            return
+        m = self.meta
+        loc = _location_from(choice.update, ctx, f"Choice {choice.name}")
+        emit(
+            Finding(
+                id=m.id,
+                title=m.title,
+                severity=m.severity,
+                confidence=m.confidence,
+                category=m.category,
+                message="Nonconsuming choice creates a new contract of the same template.",
+                location=loc,
+                evidence=[
+                    _evidence(_SELF_CREATE_EVIDENCE, choice.update.lf_ref)
+                ],
+                metadata=ctx.finding_metadata,
             )
+        )
 
 
 class NonconsumingCreateAnyRule(Rule):
@@ -127,31 +138,34 @@ class NonconsumingCreateAnyRule(Rule):
         rationale="Nonconsuming choices should avoid creating new contracts unless carefully justified.",
         tags=["lifecycle", "asset"],
     )
+    required = frozenset({"nonconsuming"})
 
     def visit_choice(self, ctx: Ctx, template: Template, choice: Choice, emit) -> None:
         if choice.consuming:
             return
-        ops = collect_update_ops(choice.update)
-        creates = [op for op in ops if op.kind in {"create", "create_interface"}]
-        if not creates:
-            return
-        # Avoid double-reporting the self-create case already covered by DAML-LIFE-001
-        if all(op.template == template.name for op in creates if op.template):
+        # Only report creates of another template; the self-create case is
+        # already covered by DAML-LIFE-001.
+        tname = template.name
+        for op in ctx.analysis.update_ops(choice.update):
+            if op.kind in {"create", "create_interface"} and op.template and op.template != tname:
+                break
+        else:
             return
+        m = self.meta
         loc = _location_from(choice.update, ctx, f"Choice {choice.name}")
         emit(
             Finding(
-                id=self.meta.id,
-                title=self.meta.title,
-                severity=self.meta.severity,
-                confidence=self.meta.confidence,
-                category=self.meta.category,
+                id=m.id,
+                title=m.title,
+                severity=m.severity,
+                confidence=m.confidence,
+                category=m.category,
                 message="Nonconsuming choice creates a contract.",
                 location=loc,
                 evidence=[
-                    Evidence(kind="update", note="update.create", lf_ref=choice.update.lf_ref)
+                    _evidence(_CREATE_EVIDENCE, choice.update.lf_ref)
                 ],
-                metadata={"template": template.name, "choice": choice.name},
+                metadata=ctx.finding_metadata,
             )
         )
 
@@ -169,22 +183,23 @@ class UncontrolledControllersRule(Rule):
     )
 
     def visit_choice(self, ctx: Ctx, template: Template, choice: Choice, emit) -> None:
-        controllers = infer_party_set(choice.controllers)
+        controllers = ctx.analysis.party_set(choice.controllers)
         if controllers.unknown:
+            m = self.meta
             loc = _location_from(choice.controllers, ctx, f"Choice {choice.name}")
             emit(
                 Finding(
-                    id=self.meta.id,
-                    title=self.meta.title,
-                    severity=self.meta.severity,
-                    confidence=self.meta.confidence,
-                    category=self.meta.category,
+                    id=m.id,
+                    title=m.title,
+                    severity=m.severity,
+                    confidence=m.confidence,
+                    category=m.category,
                     message="Choice controllers derived from uncontrolled/unknown expression.",
                     location=loc,
                     evidence=[
-                        Evidence(kind="choice", note="controllers expression", lf_ref=choice.controllers.lf_ref)
+                        _evidence(_CONTROLLERS_EVIDENCE, choice.controllers.lf_ref)
                     ],
-                    metadata={"template": template.name, "choice": choice.name},
+                    metadata=ctx.finding_metadata,
                 )
             )
 
@@ -202,20 +217,21 @@ class EmptySignatoriesRule(Rule):
     )
 
     def visit_template(self, ctx: Ctx, template: Template, emit) -> None:
-        parties = infer_party_set(template.signatories)
+        parties = ctx.analysis.party_set(template.signatories)
         if not parties.unknown and len(parties.known) == 0:
+            m = self.meta
             loc = _location_from(template.signatories, ctx, f"Template {template.name}")
             emit(
                 Finding(
-                    id=self.meta.id,
-                    title=self.meta.title,
-                    severity=self.meta.severity,
-                    confidence=self.meta.confidence,
-                    category=self.meta.category,
+                    id=m.id,
+                    title=m.title,
+                    severity=m.severity,
+                    confidence=m.confidence,
+                    category=m.category,
                     message="Template declares no signatories.",
                     location=loc,
-                    evidence=[Evidence(kind="template", note="signatories expression", lf_ref=template.signatories.lf_ref)],
-                    metadata={"template": template.name},
+                    evidence=[_evidence(_SIGNATORIES_EVIDENCE, template.signatories.lf_ref)],
+                    metadata=ctx.finding_metadata,
                 )
             )
 
@@ -231,33 +247,41 @@ class UncheckedForwardExerciseRule(Rule):
         rationale="Forwarding/exercising from a nonconsuming choice can widen authority if not guarded.",
         tags=["authorization", "forwarding"],
     )
-
-    _exercise_kinds = {
-        "exercise",
-        "exercise_by_key",
-        "exercise_interface",
-        "dynamic_exercise",
-        "soft_exercise",
-    }
+    required = frozenset({"nonconsuming"})
+
+    _exercise_kinds = frozenset(
+        {
+            "exercise",
+            "exercise_by_key",
+            "exercise_interface",
+            "dynamic_exercise",
+            "soft_exercise",
+        }
+    )
 
     def visit_choice(self, ctx: Ctx, template: Template, choice: Choice, emit) -> None:
         if choice.consuming:
             return
-        ops = collect_update_ops(choice.update)
-        if not ops or not all(op.kind in self._exercise_kinds for op in ops):
+        ops = ctx.analysis.update_ops(choice.update)
+        if not ops:
             return
+        kinds = self._exercise_kinds
+        for op in ops:
+            if op.kind not in kinds:
+                return
+        m = self.meta
         loc = _location_from(choice.update, ctx, f"Choice {choice.name}")
         emit(
             Finding(
-                id=self.meta.id,
-                title=self.meta.title,
-                severity=self.meta.severity,
-                confidence=self.meta.confidence,
-                category=self.meta.category,
+                id=m.id,
+                title=m.title,
+                severity=m.severity,
+                confidence=m.confidence,
+                category=m.category,
                 message="Nonconsuming choice forwards by exercising another choice without checks.",
                 location=loc,
-                evidence=[Evidence(kind="update", note="exercise forwarding", lf_ref=choice.update.lf_ref)],
-                metadata={"template": template.name, "choice": choice.name},
+                evidence=[_evidence(_FORWARD_EVIDENCE, choice.update.lf_ref)],
+                metadata=ctx.finding_metadata,
             )
         )
 
@@ -276,47 +300,41 @@ class OverbroadObserversRule(Rule):
 
     def visit_template(self, ctx: Ctx, template: Template, emit) -> None:
         if _expr_is_direct_party_list_var(template.observers):
+            m = self.meta
             loc = _location_from(template.observers, ctx, f"Template {template.name}")
             emit(
                 Finding(
-                    id=self.meta.id,
-                    title=self.meta.title,
-                    severity=self.meta.severity,
-                    confidence=self.meta.confidence,
-                    category=self.meta.category,
+                    id=m.id,
+                    title=m.title,
+                    severity=m.severity,
+                    confidence=m.confidence,
+                    category=m.category,
                     message="Template observers derived directly from a party list variable.",
                     location=loc,
                     evidence=[
-                        Evidence(
-                            kind="template",
-                            note="observers expression",
-                            lf_ref=template.observers.lf_ref,
-                        )
+                        _evidence(_TEMPLATE_OBSERVERS_EVIDENCE, template.observers.lf_ref)
                     ],
-                    metadata={"template": template.name},
+                    metadata=ctx.finding_metadata,
                 )
             )
 
     def visit_choice(self, ctx: Ctx, template: Template, choice: Choice, emit) -> None:
         if choice.observers and _expr_is_direct_party_list_var(choice.observers):
+            m = self.meta
             loc = _location_from(choice.observers, ctx, f"Choice {choice.name}")
             emit(
                 Finding(
-                    id=self.meta.id,
-                    title=self.meta.title,
-                    severity=self.meta.severity,
-                    confidence=self.meta.confidence,
-                    category=self.meta.category,
+                    id=m.id,
+                    title=m.title,
+                    severity=m.severity,
+                    confidence=m.confidence,
+                    category=m.category,
                     message="Choice observers derived directly from a party list variable.",
                     location=loc,
                     evidence=[
-                        Evidence(
-                            kind="choice",
-                            note="observers expression",
-                            lf_ref=choice.observers.lf_ref,
-                        )
+                        _evidence(_CHOICE_OBSERVERS_EVIDENCE, choice.observers.lf_ref)
                     ],
-                    metadata={"template": template.name, "choice": choice.name},
+                    metadata=ctx.finding_metadata,
                 )
             )
 
@@ -332,31 +350,29 @@ class KeyMaintainersAlignmentRule(Rule):
         rationale="Misaligned maintainers can enable unexpected key lookups or disclosure.",
         tags=["key", "authorization"],
     )
+    required = frozenset({"key"})
 
     def visit_template(self, ctx: Ctx, template: Template, emit) -> None:
         if not template.key:
             return
-        maintainers = infer_party_set(template.key.maintainers)
-        signatories = infer_party_set(template.signatories)
+        maintainers = ctx.analysis.party_set(template.key.maintainers)
+        signatories = ctx.analysis.party_set(template.signatories)
         if maintainers.is_definitely_not_subset_of(signatories):
+            m = self.meta
             loc = _location_from(template.key.maintainers, ctx, f"Template {template.name}")
             emit(
                 Finding(
-                    id=self.meta.id,
-                    title=self.meta.title,
-                    severity=self.meta.severity,
-                    confidence=self.meta.confidence,
-                    category=self.meta.category,
+                    id=m.id,
+                    title=m.title,
+                    severity=m.severity,
+                    confidence=m.confidence,
+                    category=m.category,
                     message="Key maintainers are not a subset of signatories.",
                     location=loc,
                     evidence=[
-                        Evidence(
-                            kind="key",
-                            note="maintainers expression",
-                            lf_ref=template.key.maintainers.lf_ref,
-                        )
+                        _evidence(_MAINTAINERS_EVIDENCE, template.key.maintainers.lf_ref)
                     ],
-                    metadata={"template": template.name},
+                    metadata=ctx.finding_metadata,
                 )
             )
 
@@ -374,20 +390,24 @@ class DeterminismTimeRule(Rule):
     )
 
     def _check(self, ctx: Ctx, owner: str, expr: Expr, emit) -> None:
-        if not _expr_contains_get_time(expr):
+        if not ctx.analysis.contains_get_time(expr):
             return
+        m = self.meta
         loc = _location_from(expr, ctx, f"{owner} expression")
         emit(
             Finding(
-                id=self.meta.id,
-                title=self.meta.title,
-                severity=self.meta.severity,
-                confidence=self.meta.confidence,
-                category=self.meta.category,
+                id=m.id,
+                title=m.title,
+                severity=m.severity,
+                confidence=m.confidence,
+                category=m.category,
                 message=f"Ledger time referenced in {owner} logic.",
                 location=loc,
                 evidence=[
-                    Evidence(kind="expr", note=f"{owner} expression", lf_ref=expr.lf_ref)
+                    _evidence(
+                        _EXPR_EVIDENCE.get(owner) or Evidence(kind="expr", note=f"{owner} expression"),
+                        expr.lf_ref,
+                    )
                 ],
                 metadata={"owner": owner, "template": ctx.template_name or ""},
             )
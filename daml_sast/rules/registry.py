@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import AbstractSet, Iterable
 
 from daml_sast.rules.base import Rule
 from daml_sast.rules.examples import (
@@ -18,30 +18,31 @@ from daml_sast.rules.examples import (
 )
 
 
+# Rules are stateless, so a single instance of each is shared by every caller.
+_RULES: tuple[Rule, ...] = (
+    AuthControllerAlignmentRule(),
+    UncontrolledControllersRule(),
+    EmptySignatoriesRule(),
+    NonconsumingCreateRule(),
+    NonconsumingCreateAnyRule(),
+    UncheckedForwardExerciseRule(),
+    OverbroadObserversRule(),
+    KeyMaintainersAlignmentRule(),
+    DeterminismTimeRule(),
+)
+
+
 def registry() -> list[Rule]:
-    return [
-        AuthControllerAlignmentRule(),
-        UncontrolledControllersRule(),
-        EmptySignatoriesRule(),
-        NonconsumingCreateRule(),
-        NonconsumingCreateAnyRule(),
-        UncheckedForwardExerciseRule(),
-        OverbroadObserversRule(),
-        KeyMaintainersAlignmentRule(),
-        DeterminismTimeRule(),
-    ]
+    return list(_RULES)
 
 
 def filter_rules(
     rules: Iterable[Rule], allowlist: set[str] | None, denylist: set[str] | None
 ) -> list[Rule]:
-    allow = allowlist or set()
-    deny = denylist or set()
-    filtered: list[Rule] = []
-    for rule in rules:
-        if allow and rule.meta.id not in allow:
-            continue
-        if rule.meta.id in deny:
-            continue
-        filtered.append(rule)
-    return filtered
+    allow = allowlist
+    deny: AbstractSet[str] = denylist or frozenset()
+    return [
+        rule
+        for rule in rules
+        if (not allow or rule.meta.id in allow) and rule.meta.id not in deny
+    ]
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import fnmatch
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 
@@ -16,6 +18,20 @@ class Suppression:
     module: Optional[str] = None
     definition: Optional[str] = None
     fingerprint: Optional[str] = None
+    module_re: Optional[re.Pattern[str]] = field(init=False, repr=False, compare=False)
+    definition_re: Optional[re.Pattern[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Globs are compiled once here rather than re-evaluated for every finding.
+        object.__setattr__(self, "module_re", _compile_glob(self.module))
+        object.__setattr__(self, "definition_re", _compile_glob(self.definition))
+
+
+@lru_cache(maxsize=None)
+def _compile_glob(pattern: Optional[str]) -> Optional[re.Pattern[str]]:
+    if pattern is None:
+        return None
+    return re.compile(fnmatch.translate(pattern))
 
 
 def load_suppressions(path: str | None) -> list[Suppression]:
@@ -43,28 +59,124 @@ def load_suppressions(path: str | None) -> list[Suppression]:
     return suppressions
 
 
-def _match(val: str | None, pattern: str | None) -> bool:
+def _match(val: str | None, pattern: Optional[re.Pattern[str]]) -> bool:
     if pattern is None:
         return True
     if val is None:
         return False
-    return fnmatch.fnmatchcase(val, pattern)
+    return pattern.match(val) is not None
+
+
+def _matches(finding: Finding, sup: Suppression) -> bool:
+    module = finding.location.module if finding.location else None
+    definition = finding.location.definition if finding.location else None
+    if not _match(module, sup.module_re) or not _match(definition, sup.definition_re):
+        return False
+    if sup.fingerprint and finding.fingerprint and sup.fingerprint != finding.fingerprint:
+        return False
+    return True
 
 
 def is_suppressed(finding: Finding, suppressions: Iterable[Suppression]) -> bool:
     for sup in suppressions:
-        if sup.rule_id != finding.id:
-            continue
-        if not _match(finding.location.module if finding.location else None, sup.module):
-            continue
-        if not _match(finding.location.definition if finding.location else None, sup.definition):
-            continue
-        if sup.fingerprint and finding.fingerprint and sup.fingerprint != finding.fingerprint:
-            continue
-        return True
+        if sup.rule_id == finding.id and _matches(finding, sup):
+            return True
     return False
 
 
+# fnmatch.translate anchors its output at the end; strip that so globs can be
+# joined into a single pattern.
+_END_ANCHOR = re.compile(r"\\[Zz]\Z")
+
+
+def _glob_body(pattern: Optional[str]) -> str:
+    if pattern is None:
+        return "(?s:.*)"
+    return _END_ANCHOR.sub("", fnmatch.translate(pattern))
+
+
+def _bucket_matcher(entries: list[Suppression]) -> re.Pattern[str]:
+    # One alternation over "module\0definition" for every entry in the bucket, so
+    # a finding is tested against all of its rule's globs in a single regex call.
+    return re.compile(
+        "|".join(f"(?:{_glob_body(sup.module)}\\x00{_glob_body(sup.definition)})" for sup in entries)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _Bucket:
+    entries: list[Suppression]
+    matcher: re.Pattern[str]
+
+
+def _index(suppressions: Iterable[Suppression]) -> dict[str, _Bucket]:
+    # Bucket by rule id so each finding is only checked against its own rule's entries.
+    by_rule: dict[str, list[Suppression]] = {}
+    for sup in suppressions:
+        by_rule.setdefault(sup.rule_id, []).append(sup)
+    return {
+        rule_id: _Bucket(entries=entries, matcher=_bucket_matcher(entries))
+        for rule_id, entries in by_rule.items()
+    }
+
+
+def _bucket_hit(buckets: dict[str, _Bucket], finding: Finding) -> bool:
+    # Callers only bucket entries whose fingerprint cannot reject the finding, so
+    # a module/definition match is enough.
+    bucket = buckets.get(finding.id)
+    if bucket is None:
+        return False
+    loc = finding.location
+    if loc is None or loc.module is None or loc.definition is None:
+        for sup in bucket.entries:
+            if _matches(finding, sup):
+                return True
+        return False
+    return bucket.matcher.fullmatch(f"{loc.module}\x00{loc.definition}") is not None
+
+
+def _pin_hit(pinned: list[Suppression], finding: Finding) -> bool:
+    rule_id = finding.id
+    for sup in pinned:
+        if sup.rule_id == rule_id and _matches(finding, sup):
+            return True
+    return False
+
+
+def _is_bare_pin(sup: Suppression) -> bool:
+    return bool(sup.fingerprint) and sup.module in (None, "*") and sup.definition in (None, "*")
+
+
 def apply_suppressions(findings: Iterable[Finding], suppressions: Iterable[Suppression]) -> list[Finding]:
     sups = list(suppressions)
-    return [f for f in findings if not is_suppressed(f, sups)]
+    # "RULE * * <fingerprint>" entries reduce to a (rule, fingerprint) membership
+    # test. When every entry has that form and every finding is fingerprinted,
+    # as in the scan command's post-fingerprint pass, filter in one batch.
+    if sups and all(_is_bare_pin(sup) for sup in sups):
+        findings = list(findings)
+        if all(f.fingerprint for f in findings):
+            pins = {(sup.rule_id, sup.fingerprint) for sup in sups}
+            return [f for f in findings if (f.id, f.fingerprint) not in pins]
+    # Entries pinned to a fingerprint are looked up directly by that fingerprint;
+    # only glob-style entries go through the rule buckets. A finding without a
+    # fingerprint can still match a pinned entry, so it checks every entry.
+    by_fp: dict[str, list[Suppression]] = {}
+    for sup in sups:
+        if sup.fingerprint:
+            by_fp.setdefault(sup.fingerprint, []).append(sup)
+    pattern_buckets = _index(sup for sup in sups if not sup.fingerprint)
+    all_buckets = _index(sups) if by_fp else pattern_buckets
+    kept: list[Finding] = []
+    keep = kept.append
+    for f in findings:
+        fp = f.fingerprint
+        if fp:
+            pinned = by_fp.get(fp)
+            if pinned and _pin_hit(pinned, f):
+                continue
+            if _bucket_hit(pattern_buckets, f):
+                continue
+        elif _bucket_hit(all_buckets, f):
+            continue
+        keep(f)
+    return kept
@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
+from typing import Any
 
 from daml_sast.rules.version import RULESET_VERSION
+from daml_sast.util.jsonio import dumps_indented, loads
 from daml_sast.util.version import get_version
 
+try:
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover
+    ijson = None
 
-def load_baseline(path: str) -> set[str]:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+# Above this size the fingerprint list is streamed instead of parsed in one go.
+_STREAM_MIN_BYTES = 10 * 1024 * 1024
+# Returned by _stream_baseline for documents it leaves to the in-memory parse.
+_UNSTREAMABLE = object()
+
+
+def load_baseline(path: str) -> frozenset[str]:
+    p = Path(path)
+    data: Any = _UNSTREAMABLE
+    if ijson is not None and p.stat().st_size > _STREAM_MIN_BYTES:
+        data = _stream_baseline(p)
+    if data is _UNSTREAMABLE:
+        data = loads(p.read_bytes())
     if isinstance(data, list):
         raise ValueError("Legacy baseline format is unsupported; regenerate the baseline")
     if isinstance(data, dict):
@@ -28,8 +44,42 @@ def load_baseline(path: str) -> set[str]:
                 f"Baseline rules version {rules_version} does not match {RULESET_VERSION}"
             )
         fingerprints = data.get("fingerprints", [])
-        return {str(x) for x in fingerprints}
-    return set()
+        if all(type(x) is str for x in fingerprints):
+            return frozenset(fingerprints)
+        return frozenset(str(x) for x in fingerprints)
+    return frozenset()
+
+
+
+def _stream_baseline(path: Path) -> Any:
+    # Only the version fields and the fingerprint set are kept; the document is
+    # never materialised as a whole. Anything but string versions and a list of
+    # string fingerprints is left to the in-memory parse, so both paths coerce
+    # odd values the same way.
+    data: dict[str, Any] = {}
+    fingerprints: set[str] = set()
+    with path.open("rb") as f:
+        events = ijson.parse(f)
+        for prefix, event, value in events:
+            if prefix == "" and event != "start_map":
+                # Legacy list baselines are rejected by the caller; other
+                # top-level values are treated as empty, as with json.loads.
+                return [] if event == "start_array" else None
+            break
+        for prefix, event, value in events:
+            if prefix == "fingerprints.item":
+                if event != "string":
+                    return _UNSTREAMABLE
+                fingerprints.add(value)
+            elif prefix == "fingerprints":
+                if event not in ("start_array", "end_array"):
+                    return _UNSTREAMABLE
+            elif prefix in ("tool_version", "rules_version"):
+                if event != "string":
+                    return _UNSTREAMABLE
+                data[prefix] = value
+    data["fingerprints"] = fingerprints
+    return data
 
 
 def write_baseline(path: str, fingerprints: list[str]) -> None:
@@ -38,4 +88,4 @@ def write_baseline(path: str, fingerprints: list[str]) -> None:
         "rules_version": RULESET_VERSION,
         "fingerprints": fingerprints,
     }
-    Path(path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    Path(path).write_text(dumps_indented(payload) + "\n", encoding="utf-8")
@@ -3,12 +3,69 @@
 from __future__ import annotations
 
 import hashlib
-import json
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii as _str
+from typing import Optional
 
 from daml_sast.model import Finding
+from daml_sast.util.jsonio import dumps_canonical
 
 
 def compute_fingerprint(finding: Finding) -> str:
+    loc = finding.location
+    span = loc.span
+    metadata = finding.metadata
+    if not all(type(v) is str for v in metadata.values()):
+        return hashlib.sha256(dumps_canonical(_payload(finding))).hexdigest()
+    return _fingerprint(
+        finding.id,
+        loc.module,
+        loc.definition,
+        None if span is None else (span.end_col, span.end_line, span.start_col, span.start_line),
+        tuple(sorted(metadata.items())),
+    )
+
+
+# Duplicate findings, and repeat scans within one process, hash identical
+# inputs only once.
+@lru_cache(maxsize=8192)
+def _fingerprint(
+    rule_id: str,
+    module: str,
+    definition: str,
+    span: Optional[tuple[Optional[int], ...]],
+    metadata: tuple[tuple[str, str], ...],
+) -> str:
+    # Writes the same bytes as dumps_canonical(_payload(finding)) (compact JSON,
+    # keys sorted, ASCII-escaped) without building the payload dict first, so
+    # fingerprints stay compatible with existing baselines.
+    parts = [
+        '{"definition":',
+        _str(definition),
+        ',"id":',
+        _str(rule_id),
+        ',"metadata":{',
+        ",".join(f"{_str(k)}:{_str(v)}" for k, v in metadata),
+        '},"module":',
+        _str(module),
+        ',"span":',
+    ]
+    if span is None:
+        parts.append("null}")
+    else:
+        end_col, end_line, start_col, start_line = span
+        parts.append(
+            f'{{"end_col":{_num(end_col)},"end_line":{_num(end_line)},'
+            f'"start_col":{_num(start_col)},"start_line":{_num(start_line)}}}}}'
+        )
+    return hashlib.sha256("".join(parts).encode("ascii")).hexdigest()
+
+
+def _num(value: Optional[int]) -> str:
+    return "null" if value is None else str(int(value))
+
+
+def _payload(finding: Finding) -> dict:
     span = None
     if finding.location.span:
         span = {
@@ -17,13 +74,10 @@ def compute_fingerprint(finding: Finding) -> str:
             "end_line": finding.location.span.end_line,
             "end_col": finding.location.span.end_col,
         }
-
-    payload = {
+    return {
         "id": finding.id,
         "module": finding.location.module,
         "definition": finding.location.definition,
         "span": span,
         "metadata": {k: finding.metadata[k] for k in sorted(finding.metadata)},
     }
-    raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
@@ -7,18 +7,30 @@ from typing import Optional
 
 
 def find_newest_dar(root: str) -> Optional[str]:
-    newest_path: Optional[str] = None
+    # scandir hands back entry type information with the listing, so only the
+    # .dar candidates need a stat call, and only the winner's path is returned.
+    newest: Optional[os.DirEntry[str]] = None
     newest_mtime = -1.0
-    for dirpath, _, filenames in os.walk(root):
-        for name in filenames:
-            if not name.endswith(".dar"):
-                continue
-            path = os.path.join(dirpath, name)
-            try:
-                mtime = os.path.getmtime(path)
-            except OSError:
-                continue
-            if mtime > newest_mtime:
-                newest_mtime = mtime
-                newest_path = path
-    return newest_path
+    stack = [root]
+    while stack:
+        subdirs: list[str] = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                            continue
+                        if entry.name[-4:] != ".dar" or not entry.is_file():
+                            continue
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if mtime > newest_mtime:
+                        newest_mtime = mtime
+                        newest = entry
+        except OSError:
+            continue
+        # Same top-down, depth-first order as os.walk.
+        stack.extend(reversed(subdirs))
+    return newest.path if newest is not None else None
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serialize ``obj`` with two-space indentation, using orjson when available.
+
+    Output is ASCII-only, as with ``json.dumps``: orjson's result is used only when
+    it has no raw UTF-8, so reports stay writable to any stream encoding.
+    """
+    if orjson is not None:
+        raw = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        if raw.isascii():
+            return raw.decode("ascii")
+    return json.dumps(obj, indent=2)
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """Compact, key-sorted, ASCII-only JSON; byte-identical to the stdlib form.
+
+    orjson writes non-ASCII text as raw UTF-8 where the stdlib escapes it, so
+    such payloads fall back to json to keep the output (and any hash of it) stable.
+    """
+    if orjson is not None:
+        raw = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        if raw.isascii():
+            return raw
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import metadata
 
 
+# Installed metadata does not change while the process runs; look it up once.
+@lru_cache(maxsize=1)
 def get_version(default: str = "0.0.1") -> str:
     try:
         return metadata.version("daml-sast")
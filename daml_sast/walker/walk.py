@@ -2,49 +2,117 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Callable, Iterable, Sequence
 
-from daml_sast.ir.model import Expr, Program
-from daml_sast.rules.base import Ctx, ExprOwner, Rule
+from daml_sast.ir.model import Choice, Expr, Module, Package, Program, Template
+from daml_sast.rules.base import Ctx, Emitter, ExprOwner, Rule
 
+TemplateVisit = Callable[[Ctx, Template, Emitter], None]
+ChoiceVisit = Callable[[Ctx, Template, Choice, Emitter], None]
+ExprVisit = Callable[[Ctx, ExprOwner, Expr, Emitter], None]
 
-def _walk_expr(expr: Expr, ctx: Ctx, owner: ExprOwner, rules: Iterable[Rule], emit) -> None:
-    for rule in rules:
-        rule.visit_expr(ctx, owner, expr, emit)
-    for child in expr.children:
-        _walk_expr(child, ctx, owner, rules, emit)
+
+def _walk_expr(expr: Expr, ctx: Ctx, owner: ExprOwner, visit_expr: Sequence[ExprVisit], emit) -> None:
+    if not visit_expr:
+        return
+    # Pre-order with an explicit stack; children are pushed reversed so they are
+    # visited left to right, as the recursive walk did.
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        for visit in visit_expr:
+            visit(ctx, owner, node, emit)
+        if node.children:
+            stack.extend(reversed(node.children))
+
+
+def _overrides(rule: Rule, name: str) -> bool:
+    return getattr(type(rule), name) is not getattr(Rule, name)
+
+
+class Visitors:
+    """Bound visit methods of a rule set, resolved once per walk.
+
+    Methods a rule inherits unchanged from Rule are no-ops and are left out.
+    """
+
+    __slots__ = ("rules", "package", "module", "expr", "_template", "_choice")
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules = tuple(rules)
+        self.package = tuple(r.visit_package for r in self.rules if _overrides(r, "visit_package"))
+        self.module = tuple(r.visit_module for r in self.rules if _overrides(r, "visit_module"))
+        self.expr = tuple(r.visit_expr for r in self.rules if _overrides(r, "visit_expr"))
+        self._template: dict[frozenset[str], tuple[TemplateVisit, ...]] = {}
+        self._choice: dict[frozenset[str], tuple[ChoiceVisit, ...]] = {}
+
+    # Only rules whose preconditions hold for the flags are returned; there are
+    # only a handful of flag combinations, so each is resolved once per walk.
+    def template(self, flags: frozenset[str]) -> tuple[TemplateVisit, ...]:
+        matched = self._template.get(flags)
+        if matched is None:
+            matched = self._template[flags] = tuple(
+                rule.visit_template
+                for rule in self.rules
+                if rule.required <= flags and _overrides(rule, "visit_template")
+            )
+        return matched
+
+    def choice(self, flags: frozenset[str]) -> tuple[ChoiceVisit, ...]:
+        matched = self._choice.get(flags)
+        if matched is None:
+            matched = self._choice[flags] = tuple(
+                rule.visit_choice
+                for rule in self.rules
+                if rule.required <= flags and _overrides(rule, "visit_choice")
+            )
+        return matched
 
 
 def walk_program(program: Program, rules: Iterable[Rule], emit) -> None:
+    visitors = Visitors(rules)
     for pkg in program.packages:
-        pkg_ctx = Ctx(package_id=pkg.package_id, module_name="")
-        for rule in rules:
-            rule.visit_package(pkg_ctx, pkg, emit)
+        walk_package(pkg, visitors, emit)
         for mod in pkg.modules:
-            mod_ctx = Ctx(package_id=pkg.package_id, module_name=mod.name)
-            for rule in rules:
-                rule.visit_module(mod_ctx, mod, emit)
-            for template in mod.templates:
-                t_ctx = mod_ctx.derive(template_name=template.name, path_append=f"template:{template.name}")
-                for rule in rules:
-                    rule.visit_template(t_ctx, template, emit)
-                _walk_expr(template.signatories, t_ctx, ExprOwner.TEMPLATE_SIGNATORIES, rules, emit)
-                _walk_expr(template.observers, t_ctx, ExprOwner.TEMPLATE_OBSERVERS, rules, emit)
-                if template.precond:
-                    _walk_expr(template.precond, t_ctx, ExprOwner.TEMPLATE_PRECOND, rules, emit)
-                if template.key:
-                    _walk_expr(template.key.body, t_ctx, ExprOwner.TEMPLATE_KEY_BODY, rules, emit)
-                    _walk_expr(template.key.maintainers, t_ctx, ExprOwner.TEMPLATE_KEY_MAINTAINERS, rules, emit)
-                for choice in template.choices:
-                    c_ctx = t_ctx.derive(choice_name=choice.name, path_append=f"choice:{choice.name}")
-                    for rule in rules:
-                        rule.visit_choice(c_ctx, template, choice, emit)
-                    _walk_expr(choice.controllers, c_ctx, ExprOwner.CHOICE_CONTROLLERS, rules, emit)
-                    if choice.observers:
-                        _walk_expr(choice.observers, c_ctx, ExprOwner.CHOICE_OBSERVERS, rules, emit)
-                    if choice.authorizers:
-                        _walk_expr(choice.authorizers, c_ctx, ExprOwner.CHOICE_AUTHORIZERS, rules, emit)
-                    _walk_expr(choice.update, c_ctx, ExprOwner.CHOICE_UPDATE, rules, emit)
-            for value in mod.values:
-                v_ctx = mod_ctx.derive(path_append=f"value:{value.name}")
-                _walk_expr(value.body, v_ctx, ExprOwner.VALUE_BODY, rules, emit)
+            walk_module(pkg, mod, visitors, emit)
+
+
+def walk_package(pkg: Package, visitors: Visitors, emit) -> None:
+    pkg_ctx = Ctx(package_id=pkg.package_id, module_name="")
+    for visit in visitors.package:
+        visit(pkg_ctx, pkg, emit)
+
+
+def walk_module(pkg: Package, mod: Module, visitors: Visitors, emit) -> None:
+    mod_ctx = Ctx(package_id=pkg.package_id, module_name=mod.name)
+    for visit in visitors.module:
+        visit(mod_ctx, mod, emit)
+    visit_expr = visitors.expr
+    for template in mod.templates:
+        t_ctx = mod_ctx.derive(template_name=template.name, path_append=f"template:{template.name}")
+        t_flags = frozenset({"key"}) if template.key else frozenset()
+        for visit_template in visitors.template(t_flags):
+            visit_template(t_ctx, template, emit)
+        _walk_expr(template.signatories, t_ctx, ExprOwner.TEMPLATE_SIGNATORIES, visit_expr, emit)
+        _walk_expr(template.observers, t_ctx, ExprOwner.TEMPLATE_OBSERVERS, visit_expr, emit)
+        if template.precond:
+            _walk_expr(template.precond, t_ctx, ExprOwner.TEMPLATE_PRECOND, visit_expr, emit)
+        if template.key:
+            _walk_expr(template.key.body, t_ctx, ExprOwner.TEMPLATE_KEY_BODY, visit_expr, emit)
+            _walk_expr(template.key.maintainers, t_ctx, ExprOwner.TEMPLATE_KEY_MAINTAINERS, visit_expr, emit)
+        for choice in template.choices:
+            c_ctx = t_ctx.derive(choice_name=choice.name, path_append=f"choice:{choice.name}")
+            c_flags = t_flags
+            if not choice.consuming:
+                c_flags = c_flags | {"nonconsuming"}
+            for visit_choice in visitors.choice(c_flags):
+                visit_choice(c_ctx, template, choice, emit)
+            _walk_expr(choice.controllers, c_ctx, ExprOwner.CHOICE_CONTROLLERS, visit_expr, emit)
+            if choice.observers:
+                _walk_expr(choice.observers, c_ctx, ExprOwner.CHOICE_OBSERVERS, visit_expr, emit)
+            if choice.authorizers:
+                _walk_expr(choice.authorizers, c_ctx, ExprOwner.CHOICE_AUTHORIZERS, visit_expr, emit)
+            _walk_expr(choice.update, c_ctx, ExprOwner.CHOICE_UPDATE, visit_expr, emit)
+    for value in mod.values:
+        v_ctx = mod_ctx.derive(path_append=f"value:{value.name}")
+        _walk_expr(value.body, v_ctx, ExprOwner.VALUE_BODY, visit_expr, emit)
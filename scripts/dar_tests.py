@@ -2,9 +2,28 @@ import glob
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+def _scan(dar: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "daml_sast.cli",
+            "scan",
+            "--dar",
+            dar,
+            "--format",
+            "json",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+
 def main(dar_glob: str, dar_dir: str, ignore_errors: bool) -> int:
     if not os.path.isdir(dar_dir):
         print(f"missing {dar_dir}; download DARs first")
@@ -15,29 +34,18 @@ def main(dar_glob: str, dar_dir: str, ignore_errors: bool) -> int:
         print(f"no .dar files found for {dar_glob}")
         return 1
 
+    # Each scan is its own interpreter process, so threads are enough to keep
+    # every CPU busy; results are printed in input order.
+    workers = min(os.cpu_count() or 1, len(dars))
     errors = 0
-    for dar in dars:
-        print(f"scanning {dar}")
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "daml_sast.cli",
-                "scan",
-                "--dar",
-                dar,
-                "--format",
-                "json",
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        if result.stdout:
-            print(result.stdout.strip())
-        if result.returncode != 0:
-            errors += 1
-            print(f"scan failed: {dar}")
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for dar, result in zip(dars, ex.map(_scan, dars)):
+            print(f"scanning {dar}")
+            if result.stdout:
+                print(result.stdout.strip())
+            if result.returncode != 0:
+                errors += 1
+                print(f"scan failed: {dar}")
 
     if errors:
         print(f"{errors} DAR(s) failed")
@@ -11,12 +11,15 @@ Sources can come from:
 import argparse
 import hashlib
 import os
-import shutil
 import sys
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+_CHUNK_SIZE = 1 << 20
+_MAX_DOWNLOADS = 8
 
 
 def parse_manifest(path: Path) -> List[Tuple[str, Optional[str], Optional[str]]]:
@@ -45,20 +48,23 @@ def parse_urls(urls: str) -> List[Tuple[str, Optional[str], Optional[str]]]:
     return [(u, None, None) for u in clean.split()]
 
 
-def sha256_file(path: Path) -> str:
+def ensure_dir(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def _copy_hashed(src: BinaryIO, dst: BinaryIO) -> str:
     h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+    while chunk := src.read(_CHUNK_SIZE):
+        dst.write(chunk)
+        h.update(chunk)
     return h.hexdigest()
 
 
-def ensure_dir(path: Path) -> None:
-    path.mkdir(parents=True, exist_ok=True)
-
+def download(url: str, dest: Path) -> str:
+    """Download from HTTP/HTTPS or copy from local path/file://.
 
-def download(url: str, dest: Path) -> None:
-    """Download from HTTP/HTTPS or copy from local path/file://."""
+    Returns the sha256 hex digest of the content, hashed while it is written.
+    """
     dest_tmp = dest.with_suffix(dest.suffix + ".tmp")
     parsed = urllib.parse.urlparse(url)
     if parsed.scheme in ("file", "local", ""):
@@ -66,11 +72,25 @@ def download(url: str, dest: Path) -> None:
         src_path = Path(parsed.path if parsed.scheme else url.replace("local:", "", 1)).resolve()
         if not src_path.exists():
             raise FileNotFoundError(src_path)
-        shutil.copyfile(src_path, dest_tmp)
+        with src_path.open("rb") as src, dest_tmp.open("wb") as f:
+            digest = _copy_hashed(src, f)
     else:
         with urllib.request.urlopen(url) as resp, dest_tmp.open("wb") as f:
-            f.write(resp.read())
+            digest = _copy_hashed(resp, f)
     dest_tmp.replace(dest)
+    return digest
+
+
+def fetch(url: str, dest: Path, sha: Optional[str]) -> Optional[Exception]:
+    """Download one source and verify its sha256; returns the error, if any."""
+    print(f"fetching {url} -> {dest}")
+    try:
+        actual = download(url, dest)
+        if sha and actual.lower() != sha.lower():
+            raise ValueError(f"sha256 mismatch for {dest}: expected {sha}, got {actual}")
+    except Exception as exc:  # noqa: BLE001
+        return exc
+    return None
 
 
 def main(argv: Iterable[str]) -> int:
@@ -94,20 +114,32 @@ def main(argv: Iterable[str]) -> int:
     failures = 0
     successes = 0
 
+    jobs = []
     for url, filename, sha in sources:
         name = filename or Path(urllib.parse.urlparse(url).path).name
-        dest = target_dir / name
-        try:
-            print(f"fetching {url} -> {dest}")
-            download(url, dest)
-            if sha:
-                actual = sha256_file(dest)
-                if actual.lower() != sha.lower():
-                    raise ValueError(f"sha256 mismatch for {dest}: expected {sha}, got {actual}")
+        jobs.append((url, target_dir / name, sha))
+
+    # Downloads are network-bound, so a few threads overlap their latencies.
+    # Sources sharing a destination stay in one task and run in manifest order,
+    # so they never write the same temp file at once and the last one wins.
+    groups: Dict[Path, List[int]] = {}
+    for i, (_, dest, _) in enumerate(jobs):
+        groups.setdefault(dest.resolve(), []).append(i)
+    outcomes: List[Optional[Exception]] = [None] * len(jobs)
+
+    def run_group(indices: List[int]) -> None:
+        for i in indices:
+            outcomes[i] = fetch(*jobs[i])
+
+    with ThreadPoolExecutor(max_workers=_MAX_DOWNLOADS) as ex:
+        list(ex.map(run_group, groups.values()))
+    # Outcomes are reported in manifest order once all have finished.
+    for (url, _, _), error in zip(jobs, outcomes):
+        if error is None:
             successes += 1
-        except Exception as exc:  # noqa: BLE001
+        else:
             failures += 1
-            print(f"failed: {url} ({exc})")
+            print(f"failed: {url} ({error})")
 
     if failures:
         print(f"{failures} download(s) failed")
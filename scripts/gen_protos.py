@@ -0,0 +1,71 @@
+"""
+Regenerate the Daml-LF protobuf modules under daml_sast/lf/proto.
+
+protoc emits absolute imports rooted at the proto package (``com.digitalasset...``).
+The generated modules are rewritten to import each other relatively and to register
+their messages under the ``daml_sast.lf.proto`` package, so no ``sys.path`` changes
+are needed to import them.
+
+Requires grpcio-tools (installed by ``make dev-deps``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+PROTO_PACKAGE = "com.digitalasset.daml.lf.archive"
+PYTHON_PACKAGE = "daml_sast.lf.proto"
+PROTOS = [
+    "com/digitalasset/daml/lf/archive/daml_lf.proto",
+    "com/digitalasset/daml/lf/archive/daml_lf1.proto",
+    "com/digitalasset/daml/lf/archive/daml_lf2.proto",
+]
+
+_ABS_IMPORT = re.compile(rf"^from {re.escape(PROTO_PACKAGE)} import (\w+) as ", re.MULTILINE)
+_MODULE_NAME = re.compile(rf"(BuildTopDescriptorsAndMessages\(DESCRIPTOR, ')({re.escape(PROTO_PACKAGE)}\.)")
+
+
+def rewrite_module(source: str) -> str:
+    source = _ABS_IMPORT.sub(r"from . import \1 as ", source)
+    return _MODULE_NAME.sub(rf"\g<1>{PYTHON_PACKAGE}.\g<2>", source)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--src", default="daml_sast/lf/proto_src", help="Proto source root")
+    parser.add_argument("--out", default="daml_sast/lf/proto", help="Output package root")
+    parser.add_argument(
+        "--rewrite-only",
+        action="store_true",
+        help="Only rewrite already generated modules (skip protoc)",
+    )
+    args = parser.parse_args()
+
+    src = Path(args.src)
+    out = Path(args.out)
+    if not args.rewrite_only:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "grpc_tools.protoc",
+                f"-I{src}",
+                f"--python_out={out}",
+                *(str(src / p) for p in PROTOS),
+            ],
+            check=True,
+        )
+
+    for proto in PROTOS:
+        module = out / proto.replace(".proto", "_pb2.py")
+        module.write_text(rewrite_module(module.read_text(encoding="utf-8")), encoding="utf-8")
+        print(f"rewrote {module}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
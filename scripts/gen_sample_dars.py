@@ -8,197 +8,197 @@ Outputs files into the target directory (default: testdata/external/dars):
 - sample-empty-sigs.dar      : triggers DAML-AUTH-003 (no signatories)
 - sample-create-any.dar      : triggers DAML-LIFE-002 (nonconsuming create other template)
 - sample-forward-exercise.dar: triggers DAML-AUTH-004 (nonconsuming forwarding exercise)
+
+With --bundle, the same DALFs are written as <fixture>/<dalf> entries of a
+single fixtures.zip instead.
 """
 
 from __future__ import annotations
 
 import argparse
-import hashlib
+import threading
 import zipfile
+from hashlib import sha256 as _sha256
 from pathlib import Path
 
 from daml_sast.lf.proto.com.digitalasset.daml.lf.archive import daml_lf1_pb2, daml_lf_pb2
 
+# Reusable ArchivePayload/Archive messages, one pair per thread. Both are fully
+# serialized before the next call clears them.
+_TLS = threading.local()
+
 
 def _archive_from_package(pkg: daml_lf1_pb2.Package) -> bytes:
-    payload = daml_lf_pb2.ArchivePayload()
+    payload = getattr(_TLS, "payload", None)
+    if payload is None:
+        payload = _TLS.payload = daml_lf_pb2.ArchivePayload()
+        _TLS.archive = daml_lf_pb2.Archive()
+    archive = _TLS.archive
+    payload.Clear()
+    archive.Clear()
+
     payload.minor = "7"
     payload.patch = 0
     payload.daml_lf_1 = pkg.SerializeToString()
 
     payload_bytes = payload.SerializeToString()
-    archive = daml_lf_pb2.Archive()
     archive.hash_function = daml_lf_pb2.SHA256
     archive.payload = payload_bytes
-    archive.hash = hashlib.sha256(payload_bytes).hexdigest()
+    # Content hash, not a security boundary; lets FIPS builds skip their checks.
+    archive.hash = _sha256(payload_bytes, usedforsecurity=False).digest().hex()
     return archive.SerializeToString()
 
 
 def _write_zip(path: Path, dalf_name: str, archive_bytes: bytes) -> None:
+    # Fixtures are a few hundred bytes; deflating them saves next to nothing.
     path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
         zf.writestr(dalf_name, archive_bytes)
 
 
-def _expr_party_list(parties, party_type, list_party_type, s_idx):
-    if not parties:
-        expr = daml_lf1_pb2.Expr()
-        expr.nil.type.CopyFrom(party_type)
-        return expr
+# Interned string table for one package under construction.
+class _Interner:
+    __slots__ = ("strings", "idx", "dname_count")
 
-    nil_expr = daml_lf1_pb2.Expr()
-    nil_expr.nil.type.CopyFrom(party_type)
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.idx: dict[str, int] = {}
+        self.dname_count = 0
 
-    cons_expr = daml_lf1_pb2.Expr()
-    cons_expr.cons.type.CopyFrom(party_type)
-    for p in parties:
-        lit = daml_lf1_pb2.Expr()
-        lit.prim_lit.party_interned_str = s_idx(p)
-        cons_expr.cons.front.append(lit)
-    cons_expr.cons.tail.CopyFrom(nil_expr)
-    return cons_expr
+    def intern(self, val: str) -> int:
+        i = self.idx.get(val)
+        if i is None:
+            i = self.idx[val] = len(self.strings)
+            self.strings.append(val)
+        return i
 
+    def add_dname(self, pkg: daml_lf1_pb2.Package, segments: list[str]) -> int:
+        dname = pkg.interned_dotted_names.add()
+        dname.segments_interned_str.extend([self.intern(seg) for seg in segments])
+        i = self.dname_count
+        self.dname_count += 1
+        return i
 
-def _expr_party_var(var, s_idx):
-    expr = daml_lf1_pb2.Expr()
-    expr.var_interned_str = s_idx(var)
-    return expr
 
+# Prototype messages shared by every builder; callers CopyFrom them.
+_PARTY_TYPE = daml_lf1_pb2.Type(prim=daml_lf1_pb2.Type.Prim(prim=daml_lf1_pb2.PARTY))
+_UNIT_TYPE = daml_lf1_pb2.Type(prim=daml_lf1_pb2.Type.Prim(prim=daml_lf1_pb2.UNIT))
+_LIST_PARTY_TYPE = daml_lf1_pb2.Type(prim=daml_lf1_pb2.Type.Prim(prim=daml_lf1_pb2.LIST, args=[_PARTY_TYPE]))
 
-def _expr_let_list(var, parties, list_party_type, s_idx):
-    block = daml_lf1_pb2.Block()
-    binding = block.bindings.add()
-    binding.binder.var_interned_str = s_idx(var)
-    binding.binder.type.CopyFrom(list_party_type)
-    binding.bound.CopyFrom(_expr_party_list(parties, list_party_type.prim.args[0], list_party_type, s_idx))
+_UNIT_EXPR = daml_lf1_pb2.Expr(prim_con=daml_lf1_pb2.CON_UNIT)
+_EMPTY_PARTY_LIST = daml_lf1_pb2.Expr(nil=daml_lf1_pb2.Expr.Nil(type=_PARTY_TYPE))
+_UPDATE_PURE_UNIT = daml_lf1_pb2.Expr(update=daml_lf1_pb2.Update(pure=daml_lf1_pb2.Pure(type=_UNIT_TYPE, expr=_UNIT_EXPR)))
 
-    body = daml_lf1_pb2.Expr()
-    body.var_interned_str = s_idx(var)
-    block.body.CopyFrom(body)
 
-    expr = daml_lf1_pb2.Expr()
-    expr.let.CopyFrom(block)
-    return expr
+def _var(idx):
+    return daml_lf1_pb2.Expr(var_interned_str=idx)
 
 
-def _expr_update_pure_unit(unit_type):
-    expr = daml_lf1_pb2.Expr()
-    expr.update.pure.type.CopyFrom(unit_type)
-    unit_expr = daml_lf1_pb2.Expr()
-    unit_expr.prim_con = daml_lf1_pb2.CON_UNIT
-    expr.update.pure.expr.CopyFrom(unit_expr)
-    return expr
+def _self_tycon(module_dn, template_dn):
+    module = daml_lf1_pb2.ModuleRef(module_name_interned_dname=module_dn)
+    # "self" can't be passed as a keyword to the pure-Python message constructor.
+    module.package_ref.self.SetInParent()
+    return daml_lf1_pb2.TypeConName(module=module, name_interned_dname=template_dn)
 
 
-def _expr_update_create(module_dn, template_dn):
-    expr = daml_lf1_pb2.Expr()
-    create = expr.update.create
+def _expr_party_list(parties, s_idx):
+    if not parties:
+        return _EMPTY_PARTY_LIST
+    front = [daml_lf1_pb2.Expr(prim_lit=daml_lf1_pb2.PrimLit(party_interned_str=s_idx(p))) for p in parties]
+    return daml_lf1_pb2.Expr(cons=daml_lf1_pb2.Expr.Cons(type=_PARTY_TYPE, front=front, tail=_EMPTY_PARTY_LIST))
 
-    tcn = daml_lf1_pb2.TypeConName()
-    tcn.module.package_ref.self.CopyFrom(daml_lf1_pb2.Unit())
-    tcn.module.module_name_interned_dname = module_dn
-    tcn.name_interned_dname = template_dn
-    create.template.CopyFrom(tcn)
 
-    unit_expr = daml_lf1_pb2.Expr()
-    unit_expr.prim_con = daml_lf1_pb2.CON_UNIT
-    create.expr.CopyFrom(unit_expr)
-    return expr
+def _expr_party_var(var, s_idx):
+    return _var(s_idx(var))
 
 
-def _expr_update_exercise(module_dn, template_dn, choice_dn, cid_var, arg_var):
-    expr = daml_lf1_pb2.Expr()
-    exercise = expr.update.exercise
+def _expr_let_list(var, parties, s_idx):
+    binding = daml_lf1_pb2.Binding(
+        binder=daml_lf1_pb2.VarWithType(var_interned_str=s_idx(var), type=_LIST_PARTY_TYPE),
+        bound=_expr_party_list(parties, s_idx),
+    )
+    return daml_lf1_pb2.Expr(let=daml_lf1_pb2.Block(bindings=[binding], body=_var(s_idx(var))))
 
-    tcn = daml_lf1_pb2.TypeConName()
-    tcn.module.package_ref.self.CopyFrom(daml_lf1_pb2.Unit())
-    tcn.module.module_name_interned_dname = module_dn
-    tcn.name_interned_dname = template_dn
-    exercise.template.CopyFrom(tcn)
-    exercise.choice_interned_str = choice_dn
 
-    cid_expr = daml_lf1_pb2.Expr()
-    cid_expr.var_interned_str = cid_var
-    exercise.cid.CopyFrom(cid_expr)
+def _expr_update_pure_unit():
+    return _UPDATE_PURE_UNIT
 
-    arg_expr = daml_lf1_pb2.Expr()
-    arg_expr.var_interned_str = arg_var
-    exercise.arg.CopyFrom(arg_expr)
-    return expr
 
+def _expr_update_create(module_dn, template_dn):
+    create = daml_lf1_pb2.Update.Create(template=_self_tycon(module_dn, template_dn), expr=_UNIT_EXPR)
+    return daml_lf1_pb2.Expr(update=daml_lf1_pb2.Update(create=create))
 
-def build_pkg_with_findings() -> daml_lf1_pb2.Package:
-    pkg = daml_lf1_pb2.Package()
-    strings: list[str] = []
-    string_idx: dict[str, int] = {}
 
-    def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
+def _expr_update_exercise(module_dn, template_dn, choice_dn, cid_var, arg_var):
+    exercise = daml_lf1_pb2.Update.Exercise(
+        template=_self_tycon(module_dn, template_dn),
+        choice_interned_str=choice_dn,
+        cid=_var(cid_var),
+        arg=_var(arg_var),
+    )
+    return daml_lf1_pb2.Expr(update=daml_lf1_pb2.Update(exercise=exercise))
 
-    def add_dname(segments):
-        dname = pkg.interned_dotted_names.add()
-        dname.segments_interned_str.extend([s_idx(seg) for seg in segments])
-        return len(pkg.interned_dotted_names) - 1
 
-    for s in ["Main", "TAuth", "TNonConsume", "Transfer", "Mint", "this", "arg", "self", "sigs", "Alice", "Bob", "TestPkg", "0.0.0"]:
-        s_idx(s)
-    pkg.interned_strings.extend(strings)
+# Interned strings every builder relies on; interned after the builder's own
+# list so existing fixtures keep their string table order.
+_COMMON_STRINGS = ("Main", "this", "arg", "self", "TestPkg", "0.0.0")
 
-    main_dn = add_dname(["Main"])
-    tauth_dn = add_dname(["TAuth"])
-    tnon_dn = add_dname(["TNonConsume"])
 
-    pkg.metadata.name_interned_str = s_idx("TestPkg")
-    pkg.metadata.version_interned_str = s_idx("0.0.0")
+# Returns (pkg, interner, module, main_dn) with metadata and the Main module set up.
+def _new_pkg_with_main(strings):
+    pkg = daml_lf1_pb2.Package()
+    interner = _Interner()
+    for s in (*strings, *_COMMON_STRINGS):
+        interner.intern(s)
+    pkg.interned_strings[:] = interner.strings
+
+    main_dn = interner.add_dname(pkg, ["Main"])
+    pkg.metadata.name_interned_str = interner.intern("TestPkg")
+    pkg.metadata.version_interned_str = interner.intern("0.0.0")
 
     mod = pkg.modules.add()
     mod.name_interned_dname = main_dn
+    return pkg, interner, mod, main_dn
 
-    party_type = daml_lf1_pb2.Type()
-    party_type.prim.prim = daml_lf1_pb2.PARTY
 
-    unit_type = daml_lf1_pb2.Type()
-    unit_type.prim.prim = daml_lf1_pb2.UNIT
+def build_pkg_with_findings() -> daml_lf1_pb2.Package:
+    pkg, interner, mod, main_dn = _new_pkg_with_main(["Main", "TAuth", "TNonConsume", "Transfer", "Mint", "this", "arg", "self", "sigs", "Alice", "Bob", "TestPkg", "0.0.0"])
+    s_idx = interner.intern
 
-    list_party_type = daml_lf1_pb2.Type()
-    list_party_type.prim.prim = daml_lf1_pb2.LIST
-    list_party_type.prim.args.extend([party_type])
+    tauth_dn = interner.add_dname(pkg, ["TAuth"])
+    tnon_dn = interner.add_dname(pkg, ["TNonConsume"])
 
     t_auth = mod.templates.add()
     t_auth.tycon_interned_dname = tauth_dn
     t_auth.param_interned_str = s_idx("this")
-    t_auth.signatories.CopyFrom(_expr_let_list("sigs", ["Alice"], list_party_type, s_idx))
-    t_auth.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    t_auth.signatories.CopyFrom(_expr_let_list("sigs", ["Alice"], s_idx))
+    t_auth.observers.CopyFrom(_expr_party_list([], s_idx))
 
     c_auth = t_auth.choices.add()
     c_auth.name_interned_str = s_idx("Transfer")
     c_auth.consuming = True
-    c_auth.controllers.CopyFrom(_expr_party_list(["Bob"], party_type, list_party_type, s_idx))
-    c_auth.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    c_auth.controllers.CopyFrom(_expr_party_list(["Bob"], s_idx))
+    c_auth.observers.CopyFrom(_expr_party_list([], s_idx))
     c_auth.arg_binder.var_interned_str = s_idx("arg")
-    c_auth.arg_binder.type.CopyFrom(party_type)
-    c_auth.ret_type.CopyFrom(unit_type)
+    c_auth.arg_binder.type.CopyFrom(_PARTY_TYPE)
+    c_auth.ret_type.CopyFrom(_UNIT_TYPE)
     c_auth.self_binder_interned_str = s_idx("self")
-    c_auth.update.CopyFrom(_expr_update_pure_unit(unit_type))
+    c_auth.update.CopyFrom(_expr_update_pure_unit())
 
     t_non = mod.templates.add()
     t_non.tycon_interned_dname = tnon_dn
     t_non.param_interned_str = s_idx("this")
-    t_non.signatories.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    t_non.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    t_non.signatories.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    t_non.observers.CopyFrom(_expr_party_list([], s_idx))
 
     c_non = t_non.choices.add()
     c_non.name_interned_str = s_idx("Mint")
     c_non.consuming = False
-    c_non.controllers.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    c_non.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    c_non.controllers.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    c_non.observers.CopyFrom(_expr_party_list([], s_idx))
     c_non.arg_binder.var_interned_str = s_idx("arg")
-    c_non.arg_binder.type.CopyFrom(party_type)
-    c_non.ret_type.CopyFrom(unit_type)
+    c_non.arg_binder.type.CopyFrom(_PARTY_TYPE)
+    c_non.ret_type.CopyFrom(_UNIT_TYPE)
     c_non.self_binder_interned_str = s_idx("self")
     c_non.update.CopyFrom(_expr_update_create(main_dn, tnon_dn))
 
@@ -206,348 +206,188 @@ def build_pkg_with_findings() -> daml_lf1_pb2.Package:
 
 
 def build_pkg_uncontrolled_controllers() -> daml_lf1_pb2.Package:
-    pkg = daml_lf1_pb2.Package()
-    strings: list[str] = []
-    string_idx: dict[str, int] = {}
-
-    def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
+    pkg, interner, mod, main_dn = _new_pkg_with_main(["Main", "TFreeCtrl", "Do", "this", "arg", "self", "Alice", "TestPkg", "0.0.0"])
+    s_idx = interner.intern
 
-    def add_dname(segments):
-        dname = pkg.interned_dotted_names.add()
-        dname.segments_interned_str.extend([s_idx(seg) for seg in segments])
-        return len(pkg.interned_dotted_names) - 1
-
-    for s in ["Main", "TFreeCtrl", "Do", "this", "arg", "self", "Alice", "TestPkg", "0.0.0"]:
-        s_idx(s)
-    pkg.interned_strings.extend(strings)
-
-    main_dn = add_dname(["Main"])
-    tfree_dn = add_dname(["TFreeCtrl"])
-
-    pkg.metadata.name_interned_str = s_idx("TestPkg")
-    pkg.metadata.version_interned_str = s_idx("0.0.0")
-
-    mod = pkg.modules.add()
-    mod.name_interned_dname = main_dn
-
-    party_type = daml_lf1_pb2.Type()
-    party_type.prim.prim = daml_lf1_pb2.PARTY
-
-    unit_type = daml_lf1_pb2.Type()
-    unit_type.prim.prim = daml_lf1_pb2.UNIT
-
-    list_party_type = daml_lf1_pb2.Type()
-    list_party_type.prim.prim = daml_lf1_pb2.LIST
-    list_party_type.prim.args.extend([party_type])
+    tfree_dn = interner.add_dname(pkg, ["TFreeCtrl"])
 
     tmpl = mod.templates.add()
     tmpl.tycon_interned_dname = tfree_dn
     tmpl.param_interned_str = s_idx("this")
-    tmpl.signatories.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    tmpl.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    tmpl.signatories.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    tmpl.observers.CopyFrom(_expr_party_list([], s_idx))
 
     choice = tmpl.choices.add()
     choice.name_interned_str = s_idx("Do")
     choice.consuming = False
     # Controllers from choice argument (uncontrolled)
     choice.controllers.CopyFrom(_expr_party_var("arg", s_idx))
-    choice.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    choice.observers.CopyFrom(_expr_party_list([], s_idx))
     choice.arg_binder.var_interned_str = s_idx("arg")
-    choice.arg_binder.type.CopyFrom(party_type)
-    choice.ret_type.CopyFrom(unit_type)
+    choice.arg_binder.type.CopyFrom(_PARTY_TYPE)
+    choice.ret_type.CopyFrom(_UNIT_TYPE)
     choice.self_binder_interned_str = s_idx("self")
-    choice.update.CopyFrom(_expr_update_pure_unit(unit_type))
+    choice.update.CopyFrom(_expr_update_pure_unit())
     return pkg
 
 
 def build_pkg_empty_signatories() -> daml_lf1_pb2.Package:
-    pkg = daml_lf1_pb2.Package()
-    strings: list[str] = []
-    string_idx: dict[str, int] = {}
-
-    def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
-
-    def add_dname(segments):
-        dname = pkg.interned_dotted_names.add()
-        dname.segments_interned_str.extend([s_idx(seg) for seg in segments])
-        return len(pkg.interned_dotted_names) - 1
-
-    for s in ["Main", "TEmpty", "Do", "this", "arg", "self", "TestPkg", "0.0.0"]:
-        s_idx(s)
-    pkg.interned_strings.extend(strings)
-
-    main_dn = add_dname(["Main"])
-    tempty_dn = add_dname(["TEmpty"])
-
-    pkg.metadata.name_interned_str = s_idx("TestPkg")
-    pkg.metadata.version_interned_str = s_idx("0.0.0")
-
-    mod = pkg.modules.add()
-    mod.name_interned_dname = main_dn
+    pkg, interner, mod, main_dn = _new_pkg_with_main(["Main", "TEmpty", "Do", "this", "arg", "self", "TestPkg", "0.0.0"])
+    s_idx = interner.intern
 
-    party_type = daml_lf1_pb2.Type()
-    party_type.prim.prim = daml_lf1_pb2.PARTY
-
-    unit_type = daml_lf1_pb2.Type()
-    unit_type.prim.prim = daml_lf1_pb2.UNIT
-
-    list_party_type = daml_lf1_pb2.Type()
-    list_party_type.prim.prim = daml_lf1_pb2.LIST
-    list_party_type.prim.args.extend([party_type])
+    tempty_dn = interner.add_dname(pkg, ["TEmpty"])
 
     tmpl = mod.templates.add()
     tmpl.tycon_interned_dname = tempty_dn
     tmpl.param_interned_str = s_idx("this")
-    tmpl.signatories.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))  # empty
-    tmpl.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    tmpl.signatories.CopyFrom(_expr_party_list([], s_idx))  # empty
+    tmpl.observers.CopyFrom(_expr_party_list([], s_idx))
 
     choice = tmpl.choices.add()
     choice.name_interned_str = s_idx("Do")
     choice.consuming = False
-    choice.controllers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
-    choice.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    choice.controllers.CopyFrom(_expr_party_list([], s_idx))
+    choice.observers.CopyFrom(_expr_party_list([], s_idx))
     choice.arg_binder.var_interned_str = s_idx("arg")
-    choice.arg_binder.type.CopyFrom(party_type)
-    choice.ret_type.CopyFrom(unit_type)
+    choice.arg_binder.type.CopyFrom(_PARTY_TYPE)
+    choice.ret_type.CopyFrom(_UNIT_TYPE)
     choice.self_binder_interned_str = s_idx("self")
-    choice.update.CopyFrom(_expr_update_pure_unit(unit_type))
+    choice.update.CopyFrom(_expr_update_pure_unit())
     return pkg
 
 
 def build_pkg_create_other() -> daml_lf1_pb2.Package:
-    pkg = daml_lf1_pb2.Package()
-    strings: list[str] = []
-    string_idx: dict[str, int] = {}
-
-    def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
-
-    def add_dname(segments):
-        dname = pkg.interned_dotted_names.add()
-        dname.segments_interned_str.extend([s_idx(seg) for seg in segments])
-        return len(pkg.interned_dotted_names) - 1
-
-    for s in ["Main", "Spawner", "Child", "Spawn", "this", "arg", "self", "Alice", "TestPkg", "0.0.0"]:
-        s_idx(s)
-    pkg.interned_strings.extend(strings)
-
-    main_dn = add_dname(["Main"])
-    spawner_dn = add_dname(["Spawner"])
-    child_dn = add_dname(["Child"])
-
-    pkg.metadata.name_interned_str = s_idx("TestPkg")
-    pkg.metadata.version_interned_str = s_idx("0.0.0")
-
-    mod = pkg.modules.add()
-    mod.name_interned_dname = main_dn
-
-    party_type = daml_lf1_pb2.Type()
-    party_type.prim.prim = daml_lf1_pb2.PARTY
+    pkg, interner, mod, main_dn = _new_pkg_with_main(["Main", "Spawner", "Child", "Spawn", "this", "arg", "self", "Alice", "TestPkg", "0.0.0"])
+    s_idx = interner.intern
 
-    unit_type = daml_lf1_pb2.Type()
-    unit_type.prim.prim = daml_lf1_pb2.UNIT
-
-    list_party_type = daml_lf1_pb2.Type()
-    list_party_type.prim.prim = daml_lf1_pb2.LIST
-    list_party_type.prim.args.extend([party_type])
+    spawner_dn = interner.add_dname(pkg, ["Spawner"])
+    child_dn = interner.add_dname(pkg, ["Child"])
 
     # Child template (unused choice)
     child = mod.templates.add()
     child.tycon_interned_dname = child_dn
     child.param_interned_str = s_idx("this")
-    child.signatories.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    child.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    child.signatories.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    child.observers.CopyFrom(_expr_party_list([], s_idx))
 
     # Spawner that creates Child in nonconsuming choice
     spawner = mod.templates.add()
     spawner.tycon_interned_dname = spawner_dn
     spawner.param_interned_str = s_idx("this")
-    spawner.signatories.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    spawner.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    spawner.signatories.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    spawner.observers.CopyFrom(_expr_party_list([], s_idx))
 
     c_spawn = spawner.choices.add()
     c_spawn.name_interned_str = s_idx("Spawn")
     c_spawn.consuming = False
-    c_spawn.controllers.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    c_spawn.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    c_spawn.controllers.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    c_spawn.observers.CopyFrom(_expr_party_list([], s_idx))
     c_spawn.arg_binder.var_interned_str = s_idx("arg")
-    c_spawn.arg_binder.type.CopyFrom(party_type)
-    c_spawn.ret_type.CopyFrom(unit_type)
+    c_spawn.arg_binder.type.CopyFrom(_PARTY_TYPE)
+    c_spawn.ret_type.CopyFrom(_UNIT_TYPE)
     c_spawn.self_binder_interned_str = s_idx("self")
     c_spawn.update.CopyFrom(_expr_update_create(main_dn, child_dn))
     return pkg
 
 
 def build_pkg_forward_exercise() -> daml_lf1_pb2.Package:
-    pkg = daml_lf1_pb2.Package()
-    strings: list[str] = []
-    string_idx: dict[str, int] = {}
-
-    def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
-
-    def add_dname(segments):
-        dname = pkg.interned_dotted_names.add()
-        dname.segments_interned_str.extend([s_idx(seg) for seg in segments])
-        return len(pkg.interned_dotted_names) - 1
-
-    for s in ["Main", "TForward", "TTarget", "Forward", "Do", "this", "arg", "self", "cid", "Alice", "Bob", "TestPkg", "0.0.0"]:
-        s_idx(s)
-    pkg.interned_strings.extend(strings)
-
-    main_dn = add_dname(["Main"])
-    fwd_dn = add_dname(["TForward"])
-    tgt_dn = add_dname(["TTarget"])
+    pkg, interner, mod, main_dn = _new_pkg_with_main(["Main", "TForward", "TTarget", "Forward", "Do", "this", "arg", "self", "cid", "Alice", "Bob", "TestPkg", "0.0.0"])
+    s_idx = interner.intern
 
-    pkg.metadata.name_interned_str = s_idx("TestPkg")
-    pkg.metadata.version_interned_str = s_idx("0.0.0")
-
-    mod = pkg.modules.add()
-    mod.name_interned_dname = main_dn
-
-    party_type = daml_lf1_pb2.Type()
-    party_type.prim.prim = daml_lf1_pb2.PARTY
-
-    unit_type = daml_lf1_pb2.Type()
-    unit_type.prim.prim = daml_lf1_pb2.UNIT
-
-    list_party_type = daml_lf1_pb2.Type()
-    list_party_type.prim.prim = daml_lf1_pb2.LIST
-    list_party_type.prim.args.extend([party_type])
+    fwd_dn = interner.add_dname(pkg, ["TForward"])
+    tgt_dn = interner.add_dname(pkg, ["TTarget"])
 
     tgt = mod.templates.add()
     tgt.tycon_interned_dname = tgt_dn
     tgt.param_interned_str = s_idx("this")
-    tgt.signatories.CopyFrom(_expr_party_list(["Bob"], party_type, list_party_type, s_idx))
-    tgt.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    tgt.signatories.CopyFrom(_expr_party_list(["Bob"], s_idx))
+    tgt.observers.CopyFrom(_expr_party_list([], s_idx))
     # Target choice doing nothing
     tgt_choice = tgt.choices.add()
     tgt_choice.name_interned_str = s_idx("Do")
     tgt_choice.consuming = True
-    tgt_choice.controllers.CopyFrom(_expr_party_list(["Bob"], party_type, list_party_type, s_idx))
-    tgt_choice.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    tgt_choice.controllers.CopyFrom(_expr_party_list(["Bob"], s_idx))
+    tgt_choice.observers.CopyFrom(_expr_party_list([], s_idx))
     tgt_choice.arg_binder.var_interned_str = s_idx("arg")
-    tgt_choice.arg_binder.type.CopyFrom(party_type)
-    tgt_choice.ret_type.CopyFrom(unit_type)
+    tgt_choice.arg_binder.type.CopyFrom(_PARTY_TYPE)
+    tgt_choice.ret_type.CopyFrom(_UNIT_TYPE)
     tgt_choice.self_binder_interned_str = s_idx("self")
-    tgt_choice.update.CopyFrom(_expr_update_pure_unit(unit_type))
+    tgt_choice.update.CopyFrom(_expr_update_pure_unit())
 
     fwd = mod.templates.add()
     fwd.tycon_interned_dname = fwd_dn
     fwd.param_interned_str = s_idx("this")
-    fwd.signatories.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    fwd.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    fwd.signatories.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    fwd.observers.CopyFrom(_expr_party_list([], s_idx))
 
     fwd_choice = fwd.choices.add()
     fwd_choice.name_interned_str = s_idx("Forward")
     fwd_choice.consuming = False
-    fwd_choice.controllers.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    fwd_choice.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    fwd_choice.controllers.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    fwd_choice.observers.CopyFrom(_expr_party_list([], s_idx))
     fwd_choice.arg_binder.var_interned_str = s_idx("arg")
-    fwd_choice.arg_binder.type.CopyFrom(party_type)
-    fwd_choice.ret_type.CopyFrom(unit_type)
+    fwd_choice.arg_binder.type.CopyFrom(_PARTY_TYPE)
+    fwd_choice.ret_type.CopyFrom(_UNIT_TYPE)
     fwd_choice.self_binder_interned_str = s_idx("self")
     # Assume cid variable is provided; for minimal sample, reuse self as cid
     fwd_choice.update.CopyFrom(_expr_update_exercise(main_dn, tgt_dn, s_idx("Do"), s_idx("self"), s_idx("arg")))
     return pkg
 def build_pkg_no_findings() -> daml_lf1_pb2.Package:
-    pkg = daml_lf1_pb2.Package()
-    strings: list[str] = []
-    string_idx: dict[str, int] = {}
-
-    def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
-
-    def add_dname(segments):
-        dname = pkg.interned_dotted_names.add()
-        dname.segments_interned_str.extend([s_idx(seg) for seg in segments])
-        return len(pkg.interned_dotted_names) - 1
+    pkg, interner, mod, main_dn = _new_pkg_with_main(["Main", "TSafe", "Do", "this", "arg", "self", "Alice", "TestPkg", "0.0.0"])
+    s_idx = interner.intern
 
-    for s in ["Main", "TSafe", "Do", "this", "arg", "self", "Alice", "TestPkg", "0.0.0"]:
-        s_idx(s)
-    pkg.interned_strings.extend(strings)
-
-    main_dn = add_dname(["Main"])
-    tsafe_dn = add_dname(["TSafe"])
-
-    pkg.metadata.name_interned_str = s_idx("TestPkg")
-    pkg.metadata.version_interned_str = s_idx("0.0.0")
-
-    mod = pkg.modules.add()
-    mod.name_interned_dname = main_dn
-
-    party_type = daml_lf1_pb2.Type()
-    party_type.prim.prim = daml_lf1_pb2.PARTY
-
-    unit_type = daml_lf1_pb2.Type()
-    unit_type.prim.prim = daml_lf1_pb2.UNIT
-
-    list_party_type = daml_lf1_pb2.Type()
-    list_party_type.prim.prim = daml_lf1_pb2.LIST
-    list_party_type.prim.args.extend([party_type])
+    tsafe_dn = interner.add_dname(pkg, ["TSafe"])
 
     t_safe = mod.templates.add()
     t_safe.tycon_interned_dname = tsafe_dn
     t_safe.param_interned_str = s_idx("this")
-    t_safe.signatories.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
-    t_safe.observers.CopyFrom(_expr_party_list([], party_type, list_party_type, s_idx))
+    t_safe.signatories.CopyFrom(_expr_party_list(["Alice"], s_idx))
+    t_safe.observers.CopyFrom(_expr_party_list([], s_idx))
 
     c_safe = t_safe.choices.add()
     c_safe.name_interned_str = s_idx("Do")
     c_safe.consuming = False
-    c_safe.controllers.CopyFrom(_expr_party_list(["Alice"], party_type, list_party_type, s_idx))
+    c_safe.controllers.CopyFrom(_expr_party_list(["Alice"], s_idx))
     c_safe.arg_binder.var_interned_str = s_idx("arg")
-    c_safe.arg_binder.type.CopyFrom(party_type)
-    c_safe.ret_type.CopyFrom(unit_type)
+    c_safe.arg_binder.type.CopyFrom(_PARTY_TYPE)
+    c_safe.ret_type.CopyFrom(_UNIT_TYPE)
     c_safe.self_binder_interned_str = s_idx("self")
-    c_safe.update.CopyFrom(_expr_update_pure_unit(unit_type))
+    c_safe.update.CopyFrom(_expr_update_pure_unit())
 
     return pkg
 
 
+# (dar file, dalf entry, builder) for every fixture written by main().
+_FIXTURES = (
+    ("sample-findings.dar", "rules.dalf", build_pkg_with_findings),
+    ("sample-clean.dar", "rules-negative.dalf", build_pkg_no_findings),
+    ("sample-uncontrolled.dar", "uncontrolled.dalf", build_pkg_uncontrolled_controllers),
+    ("sample-empty-sigs.dar", "empty-sigs.dalf", build_pkg_empty_signatories),
+    ("sample-create-any.dar", "create-any.dalf", build_pkg_create_other),
+    ("sample-forward-exercise.dar", "forward-exercise.dalf", build_pkg_forward_exercise),
+)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--out", default="testdata/external/dars", help="Output directory for generated DARs")
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Write every DALF into a single fixtures.zip instead of one DAR each",
+    )
     args = parser.parse_args()
 
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    archive_with = _archive_from_package(build_pkg_with_findings())
-    archive_without = _archive_from_package(build_pkg_no_findings())
-    archive_uncontrolled = _archive_from_package(build_pkg_uncontrolled_controllers())
-    archive_empty = _archive_from_package(build_pkg_empty_signatories())
-    archive_create_any = _archive_from_package(build_pkg_create_other())
-    archive_forward = _archive_from_package(build_pkg_forward_exercise())
-
-    _write_zip(out_dir / "sample-findings.dar", "rules.dalf", archive_with)
-    _write_zip(out_dir / "sample-clean.dar", "rules-negative.dalf", archive_without)
-    _write_zip(out_dir / "sample-uncontrolled.dar", "uncontrolled.dalf", archive_uncontrolled)
-    _write_zip(out_dir / "sample-empty-sigs.dar", "empty-sigs.dalf", archive_empty)
-    _write_zip(out_dir / "sample-create-any.dar", "create-any.dalf", archive_create_any)
-    _write_zip(out_dir / "sample-forward-exercise.dar", "forward-exercise.dalf", archive_forward)
+    if args.bundle:
+        with zipfile.ZipFile(out_dir / "fixtures.zip", "w", compression=zipfile.ZIP_STORED) as zf:
+            for dar_name, dalf_name, build in _FIXTURES:
+                zf.writestr(f"{Path(dar_name).stem}/{dalf_name}", _archive_from_package(build()))
+    else:
+        for dar_name, dalf_name, build in _FIXTURES:
+            _write_zip(out_dir / dar_name, dalf_name, _archive_from_package(build()))
 
     print(f"Wrote fixtures to {out_dir}")
     return 0
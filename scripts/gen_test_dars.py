@@ -0,0 +1,57 @@
+"""
+Generate the rule fixtures checked in under testdata/ for tests/test_rules_dalf.py.
+
+- rules.dar            : triggers DAML-AUTH-001, DAML-LIFE-001
+- rules-negative.dar   : zero findings
+- uncontrolled.dar     : triggers DAML-AUTH-002
+- empty-sigs.dar       : triggers DAML-AUTH-003
+- create-any.dar       : triggers DAML-LIFE-002
+- forward-exercise.dar : triggers DAML-AUTH-004
+
+The packages come from the gen_sample_dars builders. Rerun after changing a
+builder and commit the regenerated files; the output is byte-for-byte
+reproducible.
+"""
+
+from __future__ import annotations
+
+import argparse
+import zipfile
+from pathlib import Path
+
+import gen_sample_dars as gsd
+
+# Fixed entry timestamp so regenerated DARs only differ when the package does.
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+_TEST_DARS = (
+    ("rules.dar", "rules.dalf", gsd.build_pkg_with_findings),
+    ("rules-negative.dar", "rules-negative.dalf", gsd.build_pkg_no_findings),
+    ("uncontrolled.dar", "uncontrolled.dalf", gsd.build_pkg_uncontrolled_controllers),
+    ("empty-sigs.dar", "empty-sigs.dalf", gsd.build_pkg_empty_signatories),
+    ("create-any.dar", "create-any.dalf", gsd.build_pkg_create_other),
+    ("forward-exercise.dar", "forward-exercise.dalf", gsd.build_pkg_forward_exercise),
+)
+
+
+def _write_dar(path: Path, dalf_name: str, archive_bytes: bytes) -> None:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(zipfile.ZipInfo(dalf_name, date_time=_ZIP_DATE_TIME), archive_bytes)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default="testdata", help="Output directory for the rule DARs")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for dar_name, dalf_name, build in _TEST_DARS:
+        _write_dar(out_dir / dar_name, dalf_name, gsd._archive_from_package(build()))
+
+    print(f"Wrote rule fixtures to {out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
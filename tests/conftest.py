@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+from google.protobuf.internal import api_implementation
+
+from daml_sast.ir.model import Program
+from daml_sast.lf.loader import load_program_from_dar
+
+MINIMAL_DAR = Path(__file__).resolve().parent.parent / "testdata" / "minimal.dar"
+
+
+def pytest_report_header(config: pytest.Config) -> str:
+    return f"protobuf backend: {api_implementation.Type()}"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # The pinned protobuf wheels ship the native upb backend. Falling back to
+    # pure Python makes every decode test far slower, so fail loudly unless the
+    # fallback was asked for explicitly.
+    if (
+        api_implementation.Type() == "python"
+        and os.environ.get("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION") != "python"
+    ):
+        raise pytest.UsageError(
+            "protobuf is using the pure-Python backend; install a protobuf wheel "
+            "with the upb extension or set PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python"
+        )
+
+
+@pytest.fixture(scope="session")
+def minimal_program() -> Program:
+    # Loaded once per session; rules and tests only read the program.
+    return load_program_from_dar(str(MINIMAL_DAR))
+
+
+@pytest.fixture(scope="session")
+def minimal_dalfs() -> dict[str, bytes]:
+    # Raw DALF payloads of the minimal DAR, read with a single zip open.
+    with zipfile.ZipFile(MINIMAL_DAR) as zf:
+        return {n: zf.read(n) for n in zf.namelist() if n.endswith(".dalf")}
@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+from daml_sast.analysis.cache import AnalysisCache
+from daml_sast.analysis.lifecycle import collect_update_ops
+from daml_sast.analysis.party import infer_party_set
+from daml_sast.ir.model import Expr
+
+
+def _party_list(*parties: str) -> Expr:
+    return Expr(kind="list", children=[Expr(kind="party", value=p) for p in parties])
+
+
+def test_party_set_is_computed_once_per_expr(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Expr] = []
+
+    def counting_infer(expr: Expr):
+        calls.append(expr)
+        return infer_party_set(expr)
+
+    monkeypatch.setattr("daml_sast.analysis.cache.infer_party_set", counting_infer)
+    cache = AnalysisCache()
+    expr = _party_list("Alice", "Bob")
+    first = cache.party_set(expr)
+    second = cache.party_set(expr)
+    assert first is second
+    assert first.known == {"Alice", "Bob"}
+    assert calls == [expr]
+
+
+def test_update_ops_are_collected_once_per_expr(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Expr] = []
+
+    def counting_collect(expr: Expr):
+        calls.append(expr)
+        return collect_update_ops(expr)
+
+    monkeypatch.setattr("daml_sast.analysis.cache.collect_update_ops", counting_collect)
+    cache = AnalysisCache()
+    expr = Expr(kind="update.get_time")
+    first = cache.update_ops(expr)
+    assert cache.update_ops(expr) is first
+    assert [op.kind for op in first] == ["get_time"]
+    assert calls == [expr]
+
+
+def test_contains_get_time_finds_nested_update() -> None:
+    cache = AnalysisCache()
+    # Keep every expression alive: the cache is keyed by id().
+    nested = Expr(kind="let", children=[Expr(kind="app", children=[Expr(kind="update.get_time")])])
+    builtin = Expr(kind="builtin", value="getTime")
+    parties = _party_list("Alice")
+    assert cache.contains_get_time(nested)
+    assert cache.contains_get_time(builtin)
+    assert not cache.contains_get_time(parties)
+
+
+def test_deep_expressions_do_not_recurse() -> None:
+    root = Expr(kind="app")
+    node = root
+    for _ in range(5000):
+        child = Expr(kind="app")
+        node.children.append(child)
+        node = child
+    node.children.append(Expr(kind="update.get_time"))
+    assert AnalysisCache().contains_get_time(root)
+    assert [op.kind for op in collect_update_ops(root)] == ["get_time"]
@@ -2,28 +2,69 @@
 
 from __future__ import annotations
 
-import tempfile
-import unittest
 from pathlib import Path
 
+import pytest
+
+from daml_sast.rules.version import RULESET_VERSION
+from daml_sast.util import baseline
 from daml_sast.util.baseline import load_baseline, write_baseline
+from daml_sast.util.version import get_version
+
+
+def test_write_and_load(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    write_baseline(str(path), ["a", "b"])
+    assert load_baseline(str(path)) == {"a", "b"}
+
+
+def test_rejects_missing_version_metadata(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    path.write_text('{"fingerprints": ["a"]}\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_baseline(str(path))
+
+
+def test_non_string_fingerprints_are_coerced(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    path.write_text(_versioned('["a", 1, true]'), encoding="utf-8")
+    assert load_baseline(str(path)) == {"a", "1", "True"}
+
+
+def _load_outcome(path: Path) -> object:
+    try:
+        return load_baseline(str(path))
+    except ValueError as exc:
+        return str(exc)
 
 
-class BaselineTests(unittest.TestCase):
-    def test_write_and_load(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "baseline.json"
-            write_baseline(str(path), ["a", "b"])
-            loaded = load_baseline(str(path))
-        self.assertEqual(loaded, {"a", "b"})
+def _versioned(fingerprints: str) -> str:
+    return (
+        f'{{"tool_version": "{get_version()}", "rules_version": "{RULESET_VERSION}", '
+        f'"fingerprints": {fingerprints}}}'
+    )
 
-    def test_rejects_missing_version_metadata(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "baseline.json"
-            path.write_text('{"fingerprints": ["a"]}\n', encoding="utf-8")
-            with self.assertRaises(ValueError):
-                load_baseline(str(path))
 
+@pytest.mark.parametrize(
+    "document",
+    [
+        _versioned('["a", "b", "a"]'),
+        '["a", "b"]',
+        '"not an object"',
+        _versioned('["a", 1]'),
+        _versioned('["a", {"b": 1}]'),
+        _versioned('"a"'),
+        '{"tool_version": null, "rules_version": "1", "fingerprints": []}',
+    ],
+    ids=["baseline", "legacy_list", "scalar", "number_item", "object_item", "string_list", "null_version"],
+)
+def test_streamed_baseline_matches_in_memory_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, document: str
+) -> None:
+    pytest.importorskip("ijson")
+    path = tmp_path / "baseline.json"
+    path.write_text(document, encoding="utf-8")
+    expected = _load_outcome(path)
 
-if __name__ == "__main__":
-    unittest.main()
+    monkeypatch.setattr(baseline, "_STREAM_MIN_BYTES", 0)
+    assert _load_outcome(path) == expected
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from daml_sast.cli import _exit_code
 from daml_sast.model import Confidence, Finding, Location, Severity
 
@@ -22,13 +24,14 @@ def _finding(sev: Severity) -> Finding:
     )
 
 
-def test_exit_code_none_threshold() -> None:
-    assert _exit_code([_finding(Severity.CRITICAL)], None) == 0
-
-
-def test_exit_code_below_threshold() -> None:
-    assert _exit_code([_finding(Severity.LOW)], Severity.HIGH) == 0
-
-
-def test_exit_code_at_threshold() -> None:
-    assert _exit_code([_finding(Severity.HIGH)], Severity.HIGH) == 1
+@pytest.mark.parametrize(
+    ("sev", "threshold", "expected"),
+    [
+        (Severity.CRITICAL, None, 0),
+        (Severity.LOW, Severity.HIGH, 0),
+        (Severity.HIGH, Severity.HIGH, 1),
+    ],
+    ids=["none_threshold", "below_threshold", "at_threshold"],
+)
+def test_exit_code(sev: Severity, threshold: Severity | None, expected: int) -> None:
+    assert _exit_code([_finding(sev)], threshold) == expected
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import hashlib
-import unittest
-from unittest import mock
+
+import pytest
 
 from daml_sast.lf.archive import DalfEntry
 from daml_sast.lf.decoder import ProtoDecodeError, decode_dalf
@@ -14,30 +14,35 @@ from daml_sast.lf.proto.com.digitalasset.daml.lf.archive import (
 )
 
 
-class DecoderFallbackTests(unittest.TestCase):
-    def test_lf1_payload_with_lf2_package_fallback(self) -> None:
-        pkg = _build_minimal_lf2_package(name="daml-prim")
-        payload = daml_lf_pb2.ArchivePayload()
-        payload.minor = "14"
-        payload.patch = 0
-        payload.daml_lf_1 = pkg.SerializeToString()
+@pytest.fixture(scope="module")
+def lf2_archive_bytes() -> bytes:
+    # LF2 package wrapped in an LF1-tagged payload.
+    pkg = _build_minimal_lf2_package(name="daml-prim")
+    payload = daml_lf_pb2.ArchivePayload()
+    payload.minor = "14"
+    payload.patch = 0
+    payload.daml_lf_1 = pkg.SerializeToString()
+
+    payload_bytes = payload.SerializeToString()
+    archive = daml_lf_pb2.Archive()
+    archive.hash_function = daml_lf_pb2.SHA256
+    archive.payload = payload_bytes
+    archive.hash = hashlib.sha256(payload_bytes).hexdigest()
+    return archive.SerializeToString()
+
 
-        payload_bytes = payload.SerializeToString()
-        archive = daml_lf_pb2.Archive()
-        archive.hash_function = daml_lf_pb2.SHA256
-        archive.payload = payload_bytes
-        archive.hash = hashlib.sha256(payload_bytes).hexdigest()
+def test_lf1_payload_with_lf2_package_fallback(
+    lf2_archive_bytes: bytes, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail_lf1(*args, **kwargs):
+        raise ProtoDecodeError("lf1 decode failed")
 
-        entry = DalfEntry(path="daml-prim.dalf", raw=archive.SerializeToString())
-        with mock.patch(
-            "daml_sast.lf.decoder._decode_lf1_package",
-            side_effect=ProtoDecodeError("lf1 decode failed"),
-        ):
-            decoded = decode_dalf(entry)
+    monkeypatch.setattr("daml_sast.lf.decoder._decode_lf1_package", fail_lf1)
+    decoded = decode_dalf(DalfEntry(path="daml-prim.dalf", raw=lf2_archive_bytes))
 
-        self.assertEqual(decoded.lf_major, 2)
-        self.assertEqual(decoded.lf_version, "2.1")
-        self.assertEqual(decoded.name, "daml-prim")
+    assert decoded.lf_major == 2
+    assert decoded.lf_version == "2.1"
+    assert decoded.name == "daml-prim"
 
 
 def _build_minimal_lf2_package(name: str) -> daml_lf2_pb2.Package:
@@ -46,11 +51,11 @@ def _build_minimal_lf2_package(name: str) -> daml_lf2_pb2.Package:
     string_idx: dict[str, int] = {}
 
     def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
+        i = string_idx.get(val)
+        if i is None:
+            i = string_idx[val] = len(strings)
+            strings.append(val)
+        return i
 
     s_idx("Main")
     s_idx(name)
@@ -66,7 +71,3 @@ def _build_minimal_lf2_package(name: str) -> daml_lf2_pb2.Package:
     mod = pkg.modules.add()
     mod.name_interned_dname = 0
     return pkg
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from daml_sast.ir.model import Location, SourceSpan
+from daml_sast.model import Confidence, Finding, Severity
+from daml_sast.util.fingerprint import compute_fingerprint
+
+
+def _stdlib_fingerprint(f: Finding) -> str:
+    span = f.location.span
+    payload = {
+        "id": f.id,
+        "module": f.location.module,
+        "definition": f.location.definition,
+        "span": None
+        if span is None
+        else {
+            "start_line": span.start_line,
+            "start_col": span.start_col,
+            "end_line": span.end_line,
+            "end_col": span.end_col,
+        },
+        "metadata": dict(f.metadata),
+    }
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _finding(module: str, metadata: dict[str, str]) -> Finding:
+    return Finding(
+        id="DAML-AUTH-001",
+        title="t",
+        severity=Severity.MEDIUM,
+        confidence=Confidence.MEDIUM,
+        category="auth",
+        message="m",
+        location=Location(module=module, definition="Choice X", span=SourceSpan(None, 1, 2, 3, 4)),
+        metadata=metadata,
+    )
+
+
+def test_fingerprint_is_stable_across_encoders() -> None:
+    for f in (
+        _finding("Main", {"template": "T", "choice": "C"}),
+        _finding("Main", {}),
+        _finding("Café", {"template": "Ünïcode"}),
+    ):
+        assert compute_fingerprint(f) == _stdlib_fingerprint(f)
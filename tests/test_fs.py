@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from daml_sast.util.fs import find_newest_dar
+
+
+def test_find_newest_dar_searches_nested_dirs(tmp_path: Path) -> None:
+    old = tmp_path / "a" / "old.dar"
+    new = tmp_path / "b" / "c" / "new.dar"
+    for path, mtime in ((old, 1_000), (new, 2_000)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+        os.utime(path, (mtime, mtime))
+    (tmp_path / "b" / "notes.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "dir.dar").mkdir()
+
+    assert find_newest_dar(str(tmp_path)) == str(new)
+    assert find_newest_dar(str(tmp_path / "a")) == str(old)
+    assert find_newest_dar(str(tmp_path / "missing")) is None
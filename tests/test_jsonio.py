@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from daml_sast.model import Confidence, Finding, Location, Severity
+from daml_sast.report.json_report import emit_json
+from daml_sast.util import jsonio
+
+_DOC = {"template": "Café", "parties": ["アリス", "Bob"], "count": 2, "nested": {"ok": True}}
+
+
+def test_dumps_indented_escapes_non_ascii(monkeypatch: pytest.MonkeyPatch) -> None:
+    fast = jsonio.dumps_indented(_DOC)
+    monkeypatch.setattr(jsonio, "orjson", None)
+    fallback = jsonio.dumps_indented(_DOC)
+
+    assert fallback.isascii() and "Caf\\u00e9" in fallback
+    assert fallback == fast
+    assert jsonio.loads(fallback.encode("ascii")) == _DOC
+
+
+def test_emit_json_writes_non_ascii_metadata_to_legacy_encodings() -> None:
+    finding = Finding(
+        id="X",
+        title="t",
+        severity=Severity.LOW,
+        confidence=Confidence.LOW,
+        category="c",
+        message="m",
+        location=Location(module="M", definition="D"),
+        evidence=[],
+        related=[],
+        metadata={"template": "トークン"},
+        fingerprint=None,
+    )
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="cp1252")
+    emit_json([finding], out)
+    out.flush()
+    assert "\\u30c8" in raw.getvalue().decode("cp1252")
@@ -2,33 +2,39 @@
 
 from __future__ import annotations
 
-import os
-import tempfile
-import unittest
 import zipfile
 from pathlib import Path
 
-from daml_sast.lf.archive import extract_dalf_entries
-
-
-class LfLimitsTests(unittest.TestCase):
-    def test_rejects_oversized_dalf_entry(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            dar_path = Path(tmp) / "big.dar"
-            with zipfile.ZipFile(dar_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-                zf.writestr("big.dalf", b"x" * 32)
+import pytest
 
-            old = os.environ.get("DAML_SAST_MAX_DALF_BYTES")
-            os.environ["DAML_SAST_MAX_DALF_BYTES"] = "16"
-            try:
-                with self.assertRaises(ValueError):
-                    extract_dalf_entries(str(dar_path))
-            finally:
-                if old is None:
-                    os.environ.pop("DAML_SAST_MAX_DALF_BYTES", None)
-                else:
-                    os.environ["DAML_SAST_MAX_DALF_BYTES"] = old
-
-
-if __name__ == "__main__":
-    unittest.main()
+from daml_sast.lf.archive import extract_dalf_entries
+from daml_sast.lf.decoder import ProtoDecodeError, _enforce_proto_limits
+from daml_sast.lf.limits import _reset_limits_cache
+
+
+def test_rejects_oversized_dalf_entry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dar_path = tmp_path / "big.dar"
+    with zipfile.ZipFile(dar_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("big.dalf", b"x" * 32)
+
+    monkeypatch.setenv("DAML_SAST_MAX_DALF_BYTES", "16")
+    _reset_limits_cache()
+    try:
+        with pytest.raises(ValueError):
+            extract_dalf_entries(str(dar_path))
+    finally:
+        # The limits are cached; don't leak the patched value to other tests.
+        _reset_limits_cache()
+
+
+def test_proto_limits_walk_when_size_bound_exceeded() -> None:
+    from daml_sast.lf.proto.com.digitalasset.daml.lf.archive import daml_lf2_pb2
+
+    pkg = daml_lf2_pb2.Package()
+    for _ in range(3):
+        pkg.modules.add().name_interned_dname = 1
+    _enforce_proto_limits(pkg, max_depth=10, max_nodes=4, label="pkg")
+    with pytest.raises(ProtoDecodeError):
+        _enforce_proto_limits(pkg, max_depth=10, max_nodes=3, label="pkg")
+    with pytest.raises(ProtoDecodeError):
+        _enforce_proto_limits(pkg, max_depth=1, max_nodes=100, label="pkg")
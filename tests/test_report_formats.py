@@ -6,8 +6,8 @@ import io
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parent.parent / "scripts"))
-import gen_sample_dars as gsd  # type: ignore
+import pytest
+
 from daml_sast.engine.runner import run
 from daml_sast.lf.loader import load_program_from_dar
 from daml_sast.report.json_report import emit_json
@@ -15,16 +15,39 @@ from daml_sast.report.sarif_report import SarifContext, emit_sarif
 from daml_sast.rules.registry import registry
 
 
-def _make_dar(tmp_path: Path, name: str):
-    archive = gsd._archive_from_package(gsd.build_pkg_with_findings())
+_SCRIPTS = str(Path(__file__).resolve().parent.parent / "scripts")
+
+
+def _gsd():
+    # Imported on first use so collecting this module doesn't load the fixture
+    # generator and its protobuf modules.
+    if _SCRIPTS not in sys.path:
+        sys.path.insert(0, _SCRIPTS)
+    import gen_sample_dars  # type: ignore
+
+    return gen_sample_dars
+
+
+@pytest.fixture(scope="module")
+def sample_archive_bytes() -> bytes:
+    gsd = _gsd()
+    return gsd._archive_from_package(gsd.build_pkg_with_findings())
+
+
+@pytest.fixture(scope="module")
+def rules_registry():
+    return registry()
+
+
+def _make_dar(tmp_path: Path, name: str, archive: bytes):
     dar_path = tmp_path / name
-    gsd._write_zip(dar_path, "rules.dalf", archive)
+    _gsd()._write_zip(dar_path, "rules.dalf", archive)
     return dar_path
 
 
-def test_emit_json(tmp_path: Path) -> None:
-    dar = _make_dar(tmp_path, "sample.dar")
-    findings = run(registry(), load_program_from_dar(str(dar)))
+def test_emit_json(tmp_path: Path, sample_archive_bytes: bytes, rules_registry) -> None:
+    dar = _make_dar(tmp_path, "sample.dar", sample_archive_bytes)
+    findings = run(rules_registry, load_program_from_dar(str(dar)))
     buf = io.StringIO()
     emit_json(findings, buf)
     out = buf.getvalue()
@@ -32,16 +55,44 @@ def test_emit_json(tmp_path: Path) -> None:
     assert '"id": "DAML-AUTH-001"' in out
 
 
-def test_emit_sarif(tmp_path: Path) -> None:
-    dar = _make_dar(tmp_path, "sample.dar")
-    findings = run(registry(), load_program_from_dar(str(dar)))
+def test_emit_json_empty() -> None:
+    buf = io.StringIO()
+    emit_json([], buf)
+    assert buf.getvalue() == "[]\n"
+
+
+def test_emit_sarif(tmp_path: Path, sample_archive_bytes: bytes, rules_registry) -> None:
+    dar = _make_dar(tmp_path, "sample.dar", sample_archive_bytes)
+    findings = run(rules_registry, load_program_from_dar(str(dar)))
     buf = io.StringIO()
     from datetime import datetime, timezone
 
     now = datetime.now(timezone.utc)
     ctx = SarifContext(command_line="test", cwd="/tmp", ci=False, start_time=now, end_time=now)
-    emit_sarif(findings, buf, rule_meta={r.meta.id: r.meta for r in registry()}, context=ctx)
+    emit_sarif(findings, buf, rule_meta={r.meta.id: r.meta for r in rules_registry}, context=ctx)
     out = buf.getvalue()
     assert '"version": "2.1.0"' in out
     assert '"rules"' in out
     assert '"DAML-AUTH-001"' in out
+
+
+def test_finding_to_dict_matches_asdict() -> None:
+    from dataclasses import asdict
+
+    from daml_sast.ir.model import Location, SourceSpan
+    from daml_sast.model import Confidence, Evidence, Finding, Severity
+
+    finding = Finding(
+        id="X",
+        title="t",
+        severity=Severity.HIGH,
+        confidence=Confidence.LOW,
+        category="c",
+        message="m",
+        location=Location(module="M", definition="D", span=SourceSpan("f.daml", 1, 2, 3, 4)),
+        evidence=[Evidence(kind="k", note="n", lf_ref="r")],
+        related=[Location(module="A", definition="B")],
+        metadata={"template": "T"},
+        fingerprint="fp",
+    )
+    assert finding.to_dict() == asdict(finding)
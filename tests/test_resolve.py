@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from daml_sast.lf.resolve import ResolvedName
+
+
+def test_resolved_name_fqn_is_a_cached_method() -> None:
+    name = ResolvedName(package_id="pkg", module="Main", name="T")
+    assert name.fqn() == "Main.T"
+    assert ResolvedName(package_id="pkg", module="", name="T").fqn() == "T"
+    assert name == ResolvedName(package_id="pkg", module="Main", name="T")
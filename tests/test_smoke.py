@@ -3,44 +3,74 @@
 from __future__ import annotations
 
 import hashlib
-import unittest
+import zipfile
 from pathlib import Path
 
+import pytest
+
 from daml_sast.ir.model import Program
 from daml_sast.lf.archive import extract_dalf_entries
 from daml_sast.lf.archive import DalfEntry
 from daml_sast.lf.decoder import ProtoDecodeError, decode_dalf
-from daml_sast.lf.loader import load_program_from_dar
+from daml_sast.lf.loader import load_program_from_dar, load_program_from_dar_bytes
 
 FIXTURE = Path(__file__).resolve().parent.parent / "testdata" / "minimal.dar"
 
 
-class SmokeTests(unittest.TestCase):
-    def test_decode_dalf_extracts_payload(self) -> None:
-        entries = extract_dalf_entries(str(FIXTURE))
-        self.assertEqual(len(entries), 1)
+def _minimal_entry(minimal_dalfs: dict[str, bytes]) -> DalfEntry:
+    ((path, raw),) = minimal_dalfs.items()
+    return DalfEntry(path=path, raw=raw)
+
+
+def test_extract_dalf_entries_reads_fixture(minimal_dalfs: dict[str, bytes]) -> None:
+    entries = extract_dalf_entries(str(FIXTURE))
+    assert [(e.path, e.raw) for e in entries] == list(minimal_dalfs.items())
+
+
+def test_decode_dalf_extracts_payload(minimal_dalfs: dict[str, bytes]) -> None:
+    pkg = decode_dalf(_minimal_entry(minimal_dalfs))
+    assert pkg.lf_version == "2.1"
+    assert len(pkg.package_bytes) > 0
+    assert pkg.name == "TestPkg"
+    assert pkg.version == "TestPkg"
+
+    expected_hash = hashlib.sha256(pkg.archive_payload).hexdigest()
+    assert pkg.package_id == expected_hash
+
+
+def test_decode_dalf_can_drop_raw_payloads(minimal_dalfs: dict[str, bytes]) -> None:
+    entry = _minimal_entry(minimal_dalfs)
+    pkg = decode_dalf(entry, keep_raw=False)
+    assert pkg.archive_payload is None
+    assert pkg.package_bytes is None
+    assert pkg.package_id == decode_dalf(entry).package_id
+
+
+def test_loader_pipeline(minimal_program: Program) -> None:
+    assert isinstance(minimal_program, Program)
+    assert len(minimal_program.packages) == 1
 
-        pkg = decode_dalf(entries[0])
-        self.assertEqual(pkg.lf_version, "2.1")
-        self.assertGreater(len(pkg.package_bytes), 0)
-        self.assertEqual(pkg.name, "TestPkg")
-        self.assertEqual(pkg.version, "TestPkg")
 
-        expected_hash = hashlib.sha256(pkg.archive_payload).hexdigest()
-        self.assertEqual(pkg.package_id, expected_hash)
+def test_loader_accepts_dar_bytes() -> None:
+    program = load_program_from_dar_bytes(FIXTURE.read_bytes())
+    assert [p.package_id for p in program.packages] == [
+        p.package_id for p in load_program_from_dar(str(FIXTURE)).packages
+    ]
 
-    def test_loader_pipeline(self) -> None:
-        result = load_program_from_dar(str(FIXTURE))
-        self.assertIsInstance(result, Program)
-        self.assertEqual(len(result.packages), 1)
 
-    def test_decoder_rejects_invalid_wire_type(self) -> None:
-        # Truncated length-delimited field should fail to decode.
-        # tag=(field=3, wire=2)=0x1a, length=5 but only 1 byte of payload.
-        bad = DalfEntry(path="bad.dalf", raw=b"\x1a\x05\x00")
-        with self.assertRaises(ProtoDecodeError):
-            decode_dalf(bad)
+def test_loader_decodes_many_dalfs(tmp_path: Path, minimal_dalfs: dict[str, bytes]) -> None:
+    raw = _minimal_entry(minimal_dalfs).raw
+    dar_path = tmp_path / "many.dar"
+    with zipfile.ZipFile(dar_path, "w") as zf:
+        for i in range(6):
+            zf.writestr(f"pkg-{i}.dalf", raw)
+    result = load_program_from_dar(str(dar_path))
+    assert len(result.packages) == 6
 
 
-if __name__ == "__main__":
-    unittest.main()
+def test_decoder_rejects_invalid_wire_type() -> None:
+    # Truncated length-delimited field should fail to decode.
+    # tag=(field=3, wire=2)=0x1a, length=5 but only 1 byte of payload.
+    bad = DalfEntry(path="bad.dalf", raw=b"\x1a\x05\x00")
+    with pytest.raises(ProtoDecodeError):
+        decode_dalf(bad)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import tempfile
-import unittest
+import io
 import zipfile
-from pathlib import Path
+
+import pytest
 
 from daml_sast.lf.compat import supported_versions
-from daml_sast.lf.loader import load_program_from_dar
+from daml_sast.lf.loader import load_program_from_dar_bytes
 from daml_sast.lf.proto.com.digitalasset.daml.lf.archive import (
     daml_lf1_pb2,
     daml_lf2_pb2,
@@ -17,25 +18,24 @@ from daml_sast.lf.proto.com.digitalasset.daml.lf.archive import (
 )
 
 
-class SupportMatrixTests(unittest.TestCase):
-    def test_supported_lf_versions_load(self) -> None:
-        lf1_pkg = _build_minimal_lf1_package()
-        lf2_pkg = _build_minimal_lf2_package()
-        with tempfile.TemporaryDirectory() as tmp:
-            for version in supported_versions():
-                major, minor = (int(part) for part in version.split("."))
-                dar_path = Path(tmp) / f"lf{major}-{minor}.dar"
-                if major == 1:
-                    pkg_bytes = lf1_pkg.SerializeToString()
-                    _write_dar(dar_path, pkg_bytes, major, minor)
-                else:
-                    pkg_bytes = lf2_pkg.SerializeToString()
-                    _write_dar(dar_path, pkg_bytes, major, minor)
-                program = load_program_from_dar(str(dar_path))
-                self.assertTrue(program.packages, msg=f"Failed for LF {version}")
-
-
-def _write_dar(path: Path, pkg_bytes: bytes, major: int, minor: int) -> None:
+@pytest.mark.parametrize("version", list(supported_versions()))
+def test_supported_lf_versions_load(version: str) -> None:
+    major, minor = (int(part) for part in version.split("."))
+    pkg_bytes = _minimal_lf1_bytes() if major == 1 else _minimal_lf2_bytes()
+    program = load_program_from_dar_bytes(_dar_bytes(pkg_bytes, major, minor))
+    assert program.packages, f"Failed for LF {version}"
+
+
+def _dar_bytes(pkg_bytes: bytes, major: int, minor: int) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(f"pkg-{major}-{minor}.dalf", _archive_bytes(pkg_bytes, major, minor))
+    return buf.getvalue()
+
+
+# Archive (payload plus its SHA-256) per package and version, hashed once.
+@functools.lru_cache(maxsize=None)
+def _archive_bytes(pkg_bytes: bytes, major: int, minor: int) -> bytes:
     payload = daml_lf_pb2.ArchivePayload()
     payload.minor = f"{major}.{minor}"
     payload.patch = 0
@@ -49,9 +49,18 @@ def _write_dar(path: Path, pkg_bytes: bytes, major: int, minor: int) -> None:
     archive.hash_function = daml_lf_pb2.SHA256
     archive.payload = payload_bytes
     archive.hash = hashlib.sha256(payload_bytes).hexdigest()
+    return archive.SerializeToString()
 
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(f"pkg-{major}-{minor}.dalf", archive.SerializeToString())
+
+# Serialized once and shared by every version in the matrix.
+@functools.lru_cache(maxsize=None)
+def _minimal_lf1_bytes() -> bytes:
+    return _build_minimal_lf1_package().SerializeToString()
+
+
+@functools.lru_cache(maxsize=None)
+def _minimal_lf2_bytes() -> bytes:
+    return _build_minimal_lf2_package().SerializeToString()
 
 
 def _build_minimal_lf1_package() -> daml_lf1_pb2.Package:
@@ -60,11 +69,11 @@ def _build_minimal_lf1_package() -> daml_lf1_pb2.Package:
     string_idx: dict[str, int] = {}
 
     def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
+        i = string_idx.get(val)
+        if i is None:
+            i = string_idx[val] = len(strings)
+            strings.append(val)
+        return i
 
     s_idx("Main")
     s_idx("TestPkg")
@@ -88,11 +97,11 @@ def _build_minimal_lf2_package() -> daml_lf2_pb2.Package:
     string_idx: dict[str, int] = {}
 
     def s_idx(val: str) -> int:
-        if val in string_idx:
-            return string_idx[val]
-        string_idx[val] = len(strings)
-        strings.append(val)
-        return string_idx[val]
+        i = string_idx.get(val)
+        if i is None:
+            i = string_idx[val] = len(strings)
+            strings.append(val)
+        return i
 
     s_idx("Main")
     s_idx("TestPkg")
@@ -108,7 +117,3 @@ def _build_minimal_lf2_package() -> daml_lf2_pb2.Package:
     mod = pkg.modules.add()
     mod.name_interned_dname = 0
     return pkg
-
-
-if __name__ == "__main__":
-    unittest.main()
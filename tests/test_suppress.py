@@ -50,3 +50,73 @@ def test_apply_suppressions_with_fingerprint(tmp_path: Path) -> None:
     f2 = _finding("DAML-AUTH-002", fp="cafebabe")
     kept = apply_suppressions([f1, f2], suppressions)
     assert [f.fingerprint for f in kept] == ["cafebabe"]
+
+
+def test_apply_suppressions_literal_and_glob_patterns(tmp_path: Path) -> None:
+    sup_file = tmp_path / ".daml-sast-ignore"
+    sup_file.write_text("DAML-AUTH-002 Main.Sub\nDAML-LIFE-001 Main.* Choice?X\n", encoding="utf-8")
+    suppressions = load_suppressions(str(sup_file))
+    findings = [
+        _finding("DAML-AUTH-002", module="Main.Sub"),
+        _finding("DAML-AUTH-002", module="Main.Subx"),
+        _finding("DAML-LIFE-001", module="Main.Other"),
+        _finding("DAML-LIFE-001", module="Other"),
+    ]
+    kept = apply_suppressions(findings, suppressions)
+    assert [(f.id, f.location.module) for f in kept] == [
+        ("DAML-AUTH-002", "Main.Subx"),
+        ("DAML-LIFE-001", "Other"),
+    ]
+
+
+def test_fingerprint_suppression_applies_to_every_duplicate(tmp_path: Path) -> None:
+    sup_file = tmp_path / ".daml-sast-ignore"
+    sup_file.write_text("DAML-AUTH-002 * * deadbeef\nDAML-LIFE-001 Other\n", encoding="utf-8")
+    suppressions = load_suppressions(str(sup_file))
+    findings = [
+        _finding("DAML-AUTH-002", fp="deadbeef"),
+        _finding("DAML-AUTH-002", fp="deadbeef"),
+        _finding("DAML-LIFE-001", fp="deadbeef"),
+        _finding("DAML-AUTH-002"),
+    ]
+    kept = apply_suppressions(findings, suppressions)
+    assert [(f.id, f.fingerprint) for f in kept] == [("DAML-LIFE-001", "deadbeef")]
+
+
+def test_apply_suppressions_definition_selective_bucket(tmp_path: Path) -> None:
+    sup_file = tmp_path / ".daml-sast-ignore"
+    sup_file.write_text(
+        "DAML-AUTH-001 Main Choice?A\nDAML-AUTH-001 Main Choice?B\nDAML-AUTH-001 Main Template*\n",
+        encoding="utf-8",
+    )
+    suppressions = load_suppressions(str(sup_file))
+    findings = [
+        _finding("DAML-AUTH-001", definition="Choice B"),
+        _finding("DAML-AUTH-001", definition="Template T"),
+        _finding("DAML-AUTH-001", definition="Choice C"),
+        _finding("DAML-AUTH-001", module="Other", definition="Template T"),
+    ]
+    kept = apply_suppressions(findings, suppressions)
+    assert [(f.location.module, f.location.definition) for f in kept] == [
+        ("Main", "Choice C"),
+        ("Other", "Template T"),
+    ]
+
+
+def test_apply_suppressions_entries_do_not_mix_module_and_definition(tmp_path: Path) -> None:
+    # Each entry's module and definition globs must match together, never one
+    # entry's module with another entry's definition.
+    sup_file = tmp_path / ".daml-sast-ignore"
+    sup_file.write_text("DAML-AUTH-001 Main.* Choice?A\nDAML-AUTH-001 Other *B\n", encoding="utf-8")
+    suppressions = load_suppressions(str(sup_file))
+    findings = [
+        _finding("DAML-AUTH-001", module="Main.Sub", definition="Choice A"),
+        _finding("DAML-AUTH-001", module="Main.Sub", definition="Choice B"),
+        _finding("DAML-AUTH-001", module="Other", definition="Choice B"),
+        _finding("DAML-AUTH-001", module="Other", definition="Choice A"),
+    ]
+    kept = apply_suppressions(findings, suppressions)
+    assert [(f.location.module, f.location.definition) for f in kept] == [
+        ("Main.Sub", "Choice B"),
+        ("Other", "Choice A"),
+    ]
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from daml_sast.ir.model import Choice, Expr, Module, Package, Program, Template
+from daml_sast.rules.base import Rule
+from daml_sast.walker.walk import walk_program
+
+
+class _Recorder(Rule):
+    def __init__(self, required: frozenset[str]) -> None:
+        self.required = required
+        self.templates: list[str] = []
+        self.choices: list[str] = []
+
+    def visit_template(self, ctx, template, emit) -> None:
+        self.templates.append(template.name)
+
+    def visit_choice(self, ctx, template, choice, emit) -> None:
+        self.choices.append(choice.name)
+
+
+def _choice(name: str, consuming: bool) -> Choice:
+    party = Expr(kind="list", children=[Expr(kind="party", value="Alice")])
+    return Choice(
+        name=name,
+        consuming=consuming,
+        controllers=party,
+        observers=None,
+        authorizers=None,
+        return_type=None,
+        update=Expr(kind="update.pure"),
+    )
+
+
+def test_rules_are_dispatched_only_when_requirements_hold() -> None:
+    party = Expr(kind="list", children=[Expr(kind="party", value="Alice")])
+    template = Template(
+        name="T",
+        params=[],
+        signatories=party,
+        observers=party,
+        key=None,
+        choices=[_choice("Archive", True), _choice("Peek", False)],
+    )
+    program = Program(
+        packages=[Package("pkg", "pkg", "1.0", [Module("M", [template], [])])]
+    )
+    always = _Recorder(frozenset())
+    nonconsuming = _Recorder(frozenset({"nonconsuming"}))
+    keyed = _Recorder(frozenset({"key"}))
+
+    walk_program(program, [always, nonconsuming, keyed], lambda f: None)
+
+    assert always.templates == ["T"] and always.choices == ["Archive", "Peek"]
+    assert nonconsuming.choices == ["Peek"]
+    assert keyed.templates == [] and keyed.choices == []
+
+
+def test_choice_analyses_are_left_to_the_rules_that_need_them(monkeypatch) -> None:
+    from daml_sast.engine.runner import run
+    from daml_sast.rules.registry import registry
+
+    def fail(expr):
+        raise AssertionError("analysis run for a rule set that never reads it")
+
+    monkeypatch.setattr("daml_sast.analysis.cache.collect_update_ops", fail)
+    monkeypatch.setattr("daml_sast.analysis.cache.infer_party_set", fail)
+    party = Expr(kind="list", children=[Expr(kind="party", value="Alice")])
+    template = Template(
+        name="T", params=[], signatories=party, observers=party, key=None, choices=[_choice("Peek", False)]
+    )
+    program = Program(packages=[Package("pkg", "pkg", "1.0", [Module("M", [template], [])])])
+    rules = [r for r in registry() if r.meta.id == "DAML-DET-001"]
+
+    assert run(rules, program) == []
+
+
+def test_parallel_run_matches_serial(monkeypatch) -> None:
+    from daml_sast.engine import runner
+    from daml_sast.rules.registry import registry
+
+    empty = Expr(kind="list")
+    modules = [
+        Module(
+            f"M{m}",
+            [
+                Template(name=f"T{m}_{t}", params=[], signatories=empty, observers=empty, key=None, choices=[])
+                for t in range(3)
+            ],
+            [],
+        )
+        for m in range(4)
+    ]
+    program = Program(packages=[Package("pkg", "pkg", "1.0", modules)])
+
+    serial = runner.run(registry(), program)
+    monkeypatch.setattr(runner, "_PARALLEL_MIN_TEMPLATES", 1)
+    parallel = runner.run(registry(), program, workers=2)
+
+    assert len(serial) == 12
+    assert parallel == serial
+
+    # Each run() hands its program to its own workers, so concurrent scans of
+    # different programs do not see each other's state.
+    other = Program(packages=[Package("pkg2", "pkg2", "1.0", modules[:2])])
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        both = list(ex.map(lambda p: runner.run(registry(), p, workers=2), [program, other]))
+    assert both == [serial, runner.run(registry(), other, workers=1)]
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("the default run must not start a process pool")
+
+    monkeypatch.setattr(runner, "ProcessPoolExecutor", no_pool)
+    assert runner.run(registry(), program) == serial
+    assert runner.run(registry(), program, workers=1) == serial
+
+
+def test_expressions_are_visited_in_preorder_without_recursion() -> None:
+    class _Exprs(Rule):
+        def __init__(self) -> None:
+            self.seen: list[object] = []
+
+        def visit_expr(self, ctx, owner, expr, emit) -> None:
+            if expr.kind == "party":
+                self.seen.append(expr.value)
+
+    deep = Expr(kind="party", value="deep")
+    for _ in range(5000):
+        deep = Expr(kind="app", children=[deep])
+    signatories = Expr(
+        kind="list",
+        children=[Expr(kind="party", value="a"), Expr(kind="app", children=[Expr(kind="party", value="b")]), deep],
+    )
+    template = Template(
+        name="T", params=[], signatories=signatories, observers=Expr(kind="list"), key=None, choices=[]
+    )
+    rule = _Exprs()
+    walk_program(Program(packages=[Package("pkg", "pkg", "1.0", [Module("M", [template], [])])]), [rule], None)
+    assert rule.seen == ["a", "b", "deep"]